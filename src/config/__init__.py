@@ -134,10 +134,22 @@ def read_secret_file(filepath: str) -> Optional[str]:
         
     Example:
         >>> token = read_secret_file("/run/secrets/pushover_app_token")
+    
+    Note:
+        The file is read on every call and nothing is cached, so a rotated
+        secret is picked up immediately and old values don't linger in
+        memory. Secrets are tiny, so raw bytes are read straight from the fd
+        rather than through a buffered text wrapper.
     """
     try:
-        with open(filepath, "r") as f:
-            return f.read().strip()
+        fd = os.open(filepath, os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            chunks = []
+            while chunk := os.read(fd, 4096):
+                chunks.append(chunk)
+        finally:
+            os.close(fd)
+        return b"".join(chunks).decode("utf-8").strip()
     except FileNotFoundError:
         logger.debug("Secret file not found")
         return None
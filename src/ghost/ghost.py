@@ -82,6 +82,7 @@ Functions:
 Classes:
     GhostPostValidationError: Custom exception for schema validation failures
 """
+import atexit
 import hmac
 import ipaddress
 import html
@@ -89,10 +90,11 @@ import json
 import logging
 import os
 import re
+import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional
-from queue import Queue
+from typing import Any, Callable, Dict, Optional
+from queue import Full, Queue
 from urllib.parse import urlparse, unquote
 
 from flask import Flask, request, jsonify, current_app
@@ -576,6 +578,101 @@ def sanitize_error_message(error: Exception) -> str:
     # Default generic message
     return "Service temporarily unavailable"
 
+
+# =============================================================================
+# Background Notifications
+# =============================================================================
+
+# Pushover sends queued by webhook handlers, drained in order by one worker
+# thread per process. Each item is a tuple of zero-argument send callables.
+NOTIFY_QUEUE_SIZE = 256
+NOTIFY_DRAIN_TIMEOUT_SECONDS = 10  # How long exit waits for queued sends
+_notify_queue: Optional[Queue] = None
+_notify_worker: Optional[threading.Thread] = None
+_notify_worker_pid: Optional[int] = None
+_notify_lock = threading.Lock()
+
+
+def _notification_worker(queue: Queue) -> None:
+    """Send queued notifications until the exit sentinel (None) arrives."""
+    while True:
+        sends = queue.get()
+        try:
+            if sends is None:
+                return
+            for send in sends:
+                try:
+                    send()
+                except Exception as e:
+                    logger.error(f"Background notification failed: {e}")
+        finally:
+            queue.task_done()
+
+
+def _get_notify_queue() -> Queue:
+    """Return this process's notification queue, starting its worker if needed.
+
+    The worker is started lazily and tied to the pid that started it: the app
+    is built in the gunicorn master, and a forked worker process inherits
+    neither the thread nor a usable copy of the queue's locks.
+    """
+    global _notify_queue, _notify_worker, _notify_worker_pid
+    with _notify_lock:
+        if (
+            _notify_worker is None
+            or _notify_worker_pid != os.getpid()
+            or not _notify_worker.is_alive()
+        ):
+            _notify_queue = Queue(maxsize=NOTIFY_QUEUE_SIZE)
+            _notify_worker = threading.Thread(
+                target=_notification_worker,
+                args=(_notify_queue,),
+                name="pushover-notify",
+                daemon=True,
+            )
+            _notify_worker.start()
+            _notify_worker_pid = os.getpid()
+        return _notify_queue
+
+
+def notify_in_background(*sends: Callable[[], Any]) -> None:
+    """
+    Queue Pushover notification calls to be sent in order by a worker thread.
+
+    Webhook handlers use this so the response to Ghost doesn't wait on
+    api.pushover.net. Ghost times webhook requests out quickly, and each
+    notification is a full HTTPS round trip that can take up to the
+    notifier's 10 second timeout. The queue is bounded: under a burst that
+    outruns Pushover, further notifications are dropped with a warning rather
+    than piling up threads or memory.
+
+    Args:
+        sends: Zero-argument callables, each sending one notification
+    """
+    try:
+        _get_notify_queue().put_nowait(sends)
+    except Full:
+        logger.warning(f"Notification queue full, dropping {len(sends)} notification(s)")
+
+
+@atexit.register
+def _drain_background_notifications() -> None:
+    """Give queued notifications a bounded chance to go out at exit."""
+    worker, queue = _notify_worker, _notify_queue
+    if (
+        worker is None
+        or queue is None
+        or _notify_worker_pid != os.getpid()
+        or not worker.is_alive()
+    ):
+        return
+    try:
+        queue.put(None, timeout=NOTIFY_DRAIN_TIMEOUT_SECONDS)
+    except Full:
+        return
+    worker.join(NOTIFY_DRAIN_TIMEOUT_SECONDS)
+
+
 # Create validator for better error messages
 # Draft7Validator provides detailed validation error context including
 # the path to the failing field and the specific constraint violated
@@ -899,10 +996,10 @@ def create_app(events_queue: Queue, notifier: Optional[PushoverNotifier] = None,
 
             # Send notifications
             missing_labels = [f"{p}/{a}" for p, a in missing_accounts]
-            notifier.notify_post_received(
+            notify_in_background(lambda: notifier.notify_post_received(
                 f"{post_title} (update - syndicating to: {', '.join(missing_labels)})",
                 post_id
-            )
+            ))
 
             return jsonify({
                 "status": "success",
@@ -913,7 +1010,8 @@ def create_app(events_queue: Queue, notifier: Optional[PushoverNotifier] = None,
 
         except GhostPostValidationError as e:
             logger.error(f"Post update payload validation failed: {str(e)}")
-            notifier.notify_validation_error(str(e))
+            error_details = str(e)
+            notify_in_background(lambda: notifier.notify_validation_error(error_details))
             return jsonify({
                 "status": "error",
                 "message": "Invalid Ghost post payload"
@@ -1183,8 +1281,9 @@ def create_app(events_queue: Queue, notifier: Optional[PushoverNotifier] = None,
             # This provides a concise audit trail of received posts
             logger.info(f"Received Ghost post: id={post_id}, title='{post_title}'")
             
-            # Step 6: Send Pushover notification for post reception
-            notifier.notify_post_received(post_title, post_id)
+            # Step 6: Send Pushover notification for post reception (in the
+            # background, so Ghost gets its response without waiting)
+            notify_in_background(lambda: notifier.notify_post_received(post_title, post_id))
             
             # Step 7: Log full payload at DEBUG level
             # Pretty-print JSON for readability (indent=2)
@@ -1197,7 +1296,7 @@ def create_app(events_queue: Queue, notifier: Optional[PushoverNotifier] = None,
             logger.debug(f"Post queued for syndication: id={post_id}")
             
             # Step 9: Send Pushover notification for post queued
-            notifier.notify_post_queued(post_title, post_url)
+            notify_in_background(lambda: notifier.notify_post_queued(post_title, post_url))
             
             # Step 10: Return success response with post metadata
             return jsonify({
@@ -1212,7 +1311,8 @@ def create_app(events_queue: Queue, notifier: Optional[PushoverNotifier] = None,
             logger.error(f"Payload validation failed: {str(e)}")
 
             # Send Pushover notification for validation error
-            notifier.notify_validation_error(str(e))
+            error_details = str(e)
+            notify_in_background(lambda: notifier.notify_validation_error(error_details))
 
             return jsonify({
                 "status": "error",
@@ -159,6 +159,9 @@ class InteractionScheduler:
                 self._sync_all_posts()
             except Exception as e:
                 logger.error(f"Error in scheduler sync cycle: {e}", exc_info=True)
+            finally:
+                # Don't sit on a connection between passes (or across the fork)
+                self.sync_service.data_store.close()
 
             # Sleep for the interval (check stop event periodically)
             for _ in range(self.sync_interval_minutes * 60):
@@ -182,7 +185,10 @@ class InteractionScheduler:
         - Posts 7-30 days old: sync every 4th cycle
         - Posts > max_post_age_days: skip
         """
-        mappings = InteractionDataStore(self.sync_service.storage_path).list_syndication_mappings()
+        # Only the mapping timestamps are needed to decide what to skip; full
+        # payloads are loaded on demand for the Ghost URL/slug fallback below.
+        store = InteractionDataStore(self.sync_service.storage_path)
+        mappings = store.list_syndication_mapping_timestamps()
         if not mappings:
             logger.debug("No syndication mappings found")
             return
@@ -192,12 +198,12 @@ class InteractionScheduler:
         # starving posts when the sync interval keeps every cycle on the same hour.)
         self._sync_cycle += 1
 
-        logger.info(f"Found {len(mappings)} posts with syndication mappings")
+        logger.info("Found %d posts with syndication mappings", len(mappings))
 
         # If Ghost API is available, refresh the posts cache
         ghost_posts = self._get_ghost_posts_cache()
         if ghost_posts:
-            logger.debug(f"Ghost API returned {len(ghost_posts)} recent posts")
+            logger.debug("Ghost API returned %d recent posts", len(ghost_posts))
 
         # Track sync statistics
         synced = 0
@@ -205,8 +211,8 @@ class InteractionScheduler:
         skipped_not_in_ghost = 0
         failed = 0
 
-        for mapping in mappings:
-            ghost_post_id = str(mapping.get("ghost_post_id", ""))
+        for ghost_post_id, syndicated_at in mappings:
+            mapping = {"ghost_post_id": ghost_post_id, "syndicated_at": syndicated_at}
             if not ghost_post_id:
                 logger.warning("Skipping syndication mapping with missing ghost_post_id")
                 failed += 1
@@ -215,9 +221,11 @@ class InteractionScheduler:
             try:
                 # If Ghost API is available, check if post still exists in Ghost
                 if ghost_posts:
+                    if ghost_post_id not in ghost_posts:
+                        mapping = store.get_syndication_mapping(ghost_post_id) or mapping
                     if not self._is_post_in_ghost(ghost_post_id, mapping, ghost_posts):
                         logger.debug(
-                            f"Skipping {ghost_post_id}: not found in recent Ghost posts"
+                            "Skipping %s: not found in recent Ghost posts", ghost_post_id
                         )
                         skipped_not_in_ghost += 1
                         continue
@@ -231,7 +239,7 @@ class InteractionScheduler:
                 # Check if post is too old
                 if post_age_days > self.max_post_age_days:
                     logger.debug(
-                        f"Skipping {ghost_post_id}: too old ({post_age_days:.1f} days)"
+                        "Skipping %s: too old (%.1f days)", ghost_post_id, post_age_days
                     )
                     skipped += 1
                     continue
@@ -239,28 +247,42 @@ class InteractionScheduler:
                 # Apply smart sync strategy based on age
                 if not self._should_sync_now(post_age_days):
                     logger.debug(
-                        f"Skipping {ghost_post_id}: not due for sync "
-                        f"(age={post_age_days:.1f} days)"
+                        "Skipping %s: not due for sync (age=%.1f days)",
+                        ghost_post_id,
+                        post_age_days,
                     )
                     skipped += 1
                     continue
 
                 # Sync interactions
-                logger.debug(f"Syncing interactions for {ghost_post_id}")
+                logger.debug("Syncing interactions for %s", ghost_post_id)
                 self.sync_service.sync_post_interactions(ghost_post_id)
                 synced += 1
 
             except Exception as e:
                 logger.error(
-                    f"Failed to sync interactions for {ghost_post_id}: {e}",
+                    "Failed to sync interactions for %s: %s",
+                    ghost_post_id,
+                    e,
                     exc_info=True
                 )
                 failed += 1
 
-        log_msg = f"Sync cycle complete: synced={synced}, skipped={skipped}, failed={failed}"
         if ghost_posts:
-            log_msg += f", not_in_ghost={skipped_not_in_ghost}"
-        logger.info(log_msg)
+            logger.info(
+                "Sync cycle complete: synced=%d, skipped=%d, failed=%d, not_in_ghost=%d",
+                synced,
+                skipped,
+                failed,
+                skipped_not_in_ghost,
+            )
+        else:
+            logger.info(
+                "Sync cycle complete: synced=%d, skipped=%d, failed=%d",
+                synced,
+                skipped,
+                failed,
+            )
 
     def _sweep_loop(self) -> None:
         """Background loop running the dead-link sweep on its own thread.
@@ -278,6 +300,8 @@ class InteractionScheduler:
                 self.sync_service.prune_dead_links()
             except Exception as e:
                 logger.error(f"Error in dead-link sweep: {e}", exc_info=True)
+            finally:
+                self.sync_service.data_store.close()
 
             # Sleep for the interval (check stop event periodically)
             for _ in range(int(self.dead_link_sweep_interval_hours * 3600)):
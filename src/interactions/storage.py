@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
 import sqlite3
 import threading
-from typing import Any, Dict, Optional
+import weakref
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, Optional
 
-from jsonschema import ValidationError, validate
+from jsonschema import ValidationError
+from jsonschema.validators import validator_for
 from schema import INTERACTION_DATA_PAYLOAD_SCHEMA, SYNDICATION_MAPPING_PAYLOAD_SCHEMA
 
 logger = logging.getLogger(__name__)
@@ -36,38 +40,206 @@ def _get_db_lock(db_path: str) -> threading.RLock:
         return lock
 
 
-def _normalize_interaction_payload(data: Dict[str, Any]) -> Dict[str, Any]:
-    normalized = dict(data)
-    platforms = normalized.get("platforms")
-    if not isinstance(platforms, dict):
-        platforms = {}
-    normalized["platforms"] = {
-        "mastodon": platforms.get("mastodon", {}),
-        "bluesky": platforms.get("bluesky", {}),
+# Every live store, so cached connections can be closed before a fork.
+_live_stores: "weakref.WeakSet[InteractionDataStore]" = weakref.WeakSet()
+# Connections inherited across a fork. The child must neither use nor close
+# them (closing would touch SQLite lock state that belongs to the parent), so
+# they are kept referenced here for the life of the process.
+_inherited_connections: list = []
+
+
+def _close_connections_before_fork() -> None:
+    """Close the forking thread's cached connections so none cross the fork.
+
+    gunicorn forks its worker from the master's main thread after the app (and
+    its stores) were built. Other threads' connections can't be closed from
+    here; background loops release theirs after every pass instead (see
+    InteractionDataStore.close()).
+    """
+    for store in list(_live_stores):
+        store.close()
+
+
+os.register_at_fork(before=_close_connections_before_fork)
+
+
+_PAYLOAD_SCHEMAS = {
+    "interaction": INTERACTION_DATA_PAYLOAD_SCHEMA,
+    "syndication_mapping": SYNDICATION_MAPPING_PAYLOAD_SCHEMA,
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _get_validator(schema_id: str) -> Any:
+    """Return the compiled validator for a payload schema, building it on first use.
+
+    jsonschema.validate() checks the schema and builds a fresh validator on
+    every call; this compiles each schema once per process and shares it with
+    every store instance. Compilation is deferred until the first write, so
+    read-only processes never pay for it.
+    """
+    schema = _PAYLOAD_SCHEMAS[schema_id]
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+# Applied to every new connection. journal_mode=WAL is persistent in the
+# database file and is set once in _ensure_schema; these settings are
+# per-connection. With WAL, synchronous=NORMAL only fsyncs at checkpoints
+# rather than on every commit, and readers no longer block on writers.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+# Bump _SCHEMA_VERSION whenever _SCHEMA_SQL changes. The script stamps it into
+# PRAGMA user_version in the same transaction as the DDL, and _ensure_schema
+# skips the script entirely once the database is at (or past) this version.
+# Every statement is idempotent, so two processes racing on a fresh file is
+# harmless.
+_SCHEMA_VERSION = 1
+
+_SCHEMA_SQL = f"""
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS interaction_data (
+    ghost_post_id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_interaction_updated_at
+    ON interaction_data(updated_at);
+
+CREATE TABLE IF NOT EXISTS syndication_mappings (
+    ghost_post_id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    syndicated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_syndication_syndicated_at
+    ON syndication_mappings(syndicated_at);
+
+CREATE TABLE IF NOT EXISTS webmention_replies (
+    id TEXT PRIMARY KEY,
+    author_name TEXT NOT NULL,
+    author_url TEXT,
+    content TEXT NOT NULL,
+    target TEXT NOT NULL,
+    ip_hash TEXT,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_replies_target
+    ON webmention_replies(target);
+CREATE INDEX IF NOT EXISTS idx_replies_created_at
+    ON webmention_replies(created_at);
+
+CREATE TABLE IF NOT EXISTS sent_webmentions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source_url TEXT NOT NULL,
+    target_url TEXT NOT NULL,
+    post_id TEXT,
+    endpoint TEXT,
+    sent_at TEXT NOT NULL,
+    UNIQUE(source_url, target_url)
+);
+CREATE INDEX IF NOT EXISTS idx_sent_wm_source
+    ON sent_webmentions(source_url);
+-- (post_id, target_url) covers the per-post DISTINCT target lookup without
+-- touching the table, and still serves post_id-only lookups, so the older
+-- single-column index is redundant.
+DROP INDEX IF EXISTS idx_sent_wm_post_id;
+CREATE INDEX IF NOT EXISTS idx_sent_wm_post_target
+    ON sent_webmentions(post_id, target_url);
+
+CREATE TABLE IF NOT EXISTS received_webmentions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    mention_type TEXT DEFAULT 'mention',
+    author_name TEXT,
+    author_url TEXT,
+    author_photo TEXT,
+    content_html TEXT,
+    content_text TEXT,
+    received_at TEXT NOT NULL,
+    verified_at TEXT,
+    status TEXT DEFAULT 'pending',
+    UNIQUE(source, target)
+);
+CREATE INDEX IF NOT EXISTS idx_received_wm_target
+    ON received_webmentions(target);
+CREATE INDEX IF NOT EXISTS idx_received_wm_status
+    ON received_webmentions(status);
+
+PRAGMA user_version = {_SCHEMA_VERSION};
+
+COMMIT;
+"""
+
+# All payload (de)serialization goes through these two helpers. Payloads are
+# written without the default ", " / ": " padding, which keeps every stored row
+# (and every read of it) a little smaller at no cost.
+#
+# Writers must validate before encoding: a payload that has passed its JSON
+# schema is a plain tree of dicts, lists, strings, numbers, bools and None, so
+# the encoder's cycle-tracking is redundant and is switched off. ensure_ascii
+# stays on so a lone surrogate in user text can't break the UTF-8 bind.
+_dumps = json.JSONEncoder(separators=(",", ":"), check_circular=False).encode
+_loads = json.loads
+
+
+_PLATFORM_KEYS = {"mastodon", "bluesky"}
+
+
+def _per_platform(value: Any) -> Dict[str, Any]:
+    """Return value shaped as exactly ``{"mastodon": ..., "bluesky": ...}``.
+
+    A dict that already has exactly those keys is returned as-is; only
+    malformed values are rebuilt.
+    """
+    if _is_platform_shaped(value):
+        return value
+    if not isinstance(value, dict):
+        value = {}
+    return {
+        "mastodon": value.get("mastodon", {}),
+        "bluesky": value.get("bluesky", {}),
     }
 
-    links = normalized.get("syndication_links")
-    if not isinstance(links, dict):
-        links = {}
-    normalized["syndication_links"] = {
-        "mastodon": links.get("mastodon", {}),
-        "bluesky": links.get("bluesky", {}),
-    }
+
+def _is_platform_shaped(value: Any) -> bool:
+    return isinstance(value, dict) and value.keys() == _PLATFORM_KEYS
+
+
+def _is_normalized_interaction(data: Dict[str, Any]) -> bool:
+    return _is_platform_shaped(data.get("platforms")) and _is_platform_shaped(
+        data.get("syndication_links")
+    )
+
+
+def _normalize_interaction_payload(data: Dict[str, Any]) -> Dict[str, Any]:
+    normalized = dict(data)
+    normalized["platforms"] = _per_platform(normalized.get("platforms"))
+    normalized["syndication_links"] = _per_platform(normalized.get("syndication_links"))
     return normalized
 
 
 def _normalize_syndication_mapping_payload(mapping: Dict[str, Any]) -> Dict[str, Any]:
     normalized = dict(mapping)
-    platforms = normalized.get("platforms")
-    if not isinstance(platforms, dict):
-        platforms = {}
-    normalized["platforms"] = {
-        "mastodon": platforms.get("mastodon", {}),
-        "bluesky": platforms.get("bluesky", {}),
-    }
+    normalized["platforms"] = _per_platform(normalized.get("platforms"))
     return normalized
 
 
+# Rows fetched per cursor round-trip when streaming syndication mappings.
+_ITER_FETCH_SIZE = 256
+
+# Column order of the webmention_replies SELECT in get_reply().
+_REPLY_FIELDS = ("id", "author_name", "author_url", "content", "target", "ip_hash", "created_at")
+
+
 class InteractionDataStore:
     """Persistent interaction storage backed by SQLite."""
 
@@ -76,6 +248,9 @@ class InteractionDataStore:
         os.makedirs(self.storage_path, mode=0o755, exist_ok=True)
         self.db_path = os.path.join(self.storage_path, "interactions.db")
         self._lock = _get_db_lock(self.db_path)
+        # Per-thread connection cache; see _connect().
+        self._local = threading.local()
+        _live_stores.add(self)
         self._ensure_schema()
 
     def transaction(self) -> threading.RLock:
@@ -95,110 +270,64 @@ class InteractionDataStore:
         return self._lock
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Return this thread's connection, opening it on first use.
+
+        Connections are reused across calls rather than reopened for every
+        operation. ``with self._connect() as conn:`` still commits (or rolls
+        back) each operation but leaves the connection open. The cached
+        connection is tied to the pid that opened it: gunicorn forks its worker
+        after the app (and its stores) were built in the master, and an SQLite
+        connection must never be used across a fork. A handle inherited that
+        way is set aside, unclosed, and the child opens its own.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            if conn is not None:
+                _inherited_connections.append(conn)
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
         return conn
 
+    def close(self) -> None:
+        """Close the calling thread's cached connection, if it has one.
+
+        Long-running background loops call this after every pass so that an
+        idle thread never holds a connection open, in particular across the
+        gunicorn fork. The next operation on this thread reconnects.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            return
+        self._local.conn = None
+        if self._local.pid == os.getpid():
+            conn.close()
+        else:
+            _inherited_connections.append(conn)
+
     def _ensure_schema(self) -> None:
+        # A throwaway connection rather than the cached one: stores are built in
+        # the gunicorn master's main thread, and nothing opened there should
+        # still be open when that thread forks the worker.
         try:
-            with self._connect() as conn:
-                conn.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS interaction_data (
-                        ghost_post_id TEXT PRIMARY KEY,
-                        payload TEXT NOT NULL,
-                        updated_at TEXT NOT NULL
-                    )
-                    """
-                )
-                conn.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_interaction_updated_at "
-                    "ON interaction_data(updated_at)"
-                )
-                conn.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS syndication_mappings (
-                        ghost_post_id TEXT PRIMARY KEY,
-                        payload TEXT NOT NULL,
-                        syndicated_at TEXT NOT NULL
-                    )
-                    """
-                )
-                conn.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_syndication_syndicated_at "
-                    "ON syndication_mappings(syndicated_at)"
-                )
-                conn.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS webmention_replies (
-                        id TEXT PRIMARY KEY,
-                        author_name TEXT NOT NULL,
-                        author_url TEXT,
-                        content TEXT NOT NULL,
-                        target TEXT NOT NULL,
-                        ip_hash TEXT,
-                        created_at TEXT NOT NULL
-                    )
-                    """
-                )
-                conn.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_replies_target "
-                    "ON webmention_replies(target)"
-                )
-                conn.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_replies_created_at "
-                    "ON webmention_replies(created_at)"
-                )
-                conn.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS sent_webmentions (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        source_url TEXT NOT NULL,
-                        target_url TEXT NOT NULL,
-                        post_id TEXT,
-                        endpoint TEXT,
-                        sent_at TEXT NOT NULL,
-                        UNIQUE(source_url, target_url)
-                    )
-                    """
-                )
-                conn.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_sent_wm_source "
-                    "ON sent_webmentions(source_url)"
-                )
-                conn.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_sent_wm_post_id "
-                    "ON sent_webmentions(post_id)"
-                )
-                conn.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS received_webmentions (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        source TEXT NOT NULL,
-                        target TEXT NOT NULL,
-                        mention_type TEXT DEFAULT 'mention',
-                        author_name TEXT,
-                        author_url TEXT,
-                        author_photo TEXT,
-                        content_html TEXT,
-                        content_text TEXT,
-                        received_at TEXT NOT NULL,
-                        verified_at TEXT,
-                        status TEXT DEFAULT 'pending',
-                        UNIQUE(source, target)
-                    )
-                    """
-                )
-                conn.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_received_wm_target "
-                    "ON received_webmentions(target)"
-                )
-                conn.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_received_wm_status "
-                    "ON received_webmentions(status)"
-                )
+            conn = sqlite3.connect(self.db_path)
         except sqlite3.Error as e:
             logger.error(f"Failed to initialize interactions database {self.db_path}: {e}")
+            return
+        try:
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+                return
+            # journal_mode can't be changed inside a transaction, so it runs
+            # ahead of the script rather than as part of it.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA_SQL)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to initialize interactions database {self.db_path}: {e}")
+        finally:
+            conn.close()
 
     def get(self, ghost_post_id: str) -> Optional[Dict[str, Any]]:
         """Get interaction payload by post ID from SQLite."""
@@ -209,7 +338,7 @@ class InteractionDataStore:
                     (ghost_post_id,),
                 ).fetchone()
                 if row:
-                    return json.loads(row["payload"])
+                    return _loads(row["payload"])
         except (sqlite3.Error, json.JSONDecodeError) as e:
             logger.error(f"Failed to read interaction data for {ghost_post_id} from SQLite: {e}")
 
@@ -217,15 +346,18 @@ class InteractionDataStore:
 
     def put(self, ghost_post_id: str, data: Dict[str, Any]) -> None:
         """Upsert interaction payload by post ID."""
-        data = _normalize_interaction_payload(data)
+        # Payloads read back from the store are already normalized; only
+        # reshape (and copy) ones that aren't.
+        if not _is_normalized_interaction(data):
+            data = _normalize_interaction_payload(data)
         try:
-            validate(instance=data, schema=INTERACTION_DATA_PAYLOAD_SCHEMA)
+            _get_validator("interaction").validate(data)
         except ValidationError as e:
             logger.error(f"Invalid interaction payload for {ghost_post_id}: {e.message}")
             return
 
         updated_at = str(data.get("updated_at", ""))
-        payload = json.dumps(data)
+        payload = _dumps(data)
 
         try:
             with self._connect() as conn:
@@ -266,7 +398,7 @@ class InteractionDataStore:
                     (ghost_post_id,),
                 ).fetchone()
                 if row:
-                    return json.loads(row["payload"])
+                    return _loads(row["payload"])
         except (sqlite3.Error, json.JSONDecodeError) as e:
             logger.error(
                 f"Failed to read syndication mapping for {ghost_post_id} from SQLite: {e}"
@@ -276,15 +408,16 @@ class InteractionDataStore:
 
     def put_syndication_mapping(self, ghost_post_id: str, mapping: Dict[str, Any]) -> None:
         """Upsert syndication mapping by post ID."""
-        mapping = _normalize_syndication_mapping_payload(mapping)
+        if not _is_platform_shaped(mapping.get("platforms")):
+            mapping = _normalize_syndication_mapping_payload(mapping)
         try:
-            validate(instance=mapping, schema=SYNDICATION_MAPPING_PAYLOAD_SCHEMA)
+            _get_validator("syndication_mapping").validate(mapping)
         except ValidationError as e:
             logger.error(f"Invalid syndication mapping payload for {ghost_post_id}: {e.message}")
             return
 
         syndicated_at = str(mapping.get("syndicated_at", ""))
-        payload = json.dumps(mapping)
+        payload = _dumps(mapping)
 
         try:
             with self._connect() as conn:
@@ -336,15 +469,7 @@ class InteractionDataStore:
                     (reply_id,),
                 ).fetchone()
                 if row:
-                    return {
-                        "id": row["id"],
-                        "author_name": row["author_name"],
-                        "author_url": row["author_url"],
-                        "content": row["content"],
-                        "target": row["target"],
-                        "ip_hash": row["ip_hash"],
-                        "created_at": row["created_at"],
-                    }
+                    return dict(zip(_REPLY_FIELDS, row))
         except sqlite3.Error as e:
             logger.error(f"Failed to read reply {reply_id}: {e}")
         return None
@@ -362,26 +487,60 @@ class InteractionDataStore:
             logger.error(f"Failed to delete reply {reply_id}: {e}")
             raise
 
+    def iter_syndication_mappings(self) -> Iterator[Dict[str, Any]]:
+        """Yield every syndication mapping stored in SQLite, newest first.
+
+        Rows are decoded one at a time straight off the cursor, so only the
+        mapping currently being handled is held in memory. Callers must not
+        write to ``syndication_mappings`` while iterating; use
+        ``list_syndication_mappings`` to take a snapshot first.
+        """
+        try:
+            cursor = self._connect().execute(
+                "SELECT ghost_post_id, payload FROM syndication_mappings "
+                "ORDER BY syndicated_at DESC"
+            )
+            # Pull rows in batches rather than one fetch per row; each batch is
+            # still decoded and yielded one mapping at a time.
+            cursor.arraysize = _ITER_FETCH_SIZE
+            while rows := cursor.fetchmany():
+                for ghost_post_id, payload in rows:
+                    try:
+                        mapping = _loads(payload)
+                    except json.JSONDecodeError:
+                        logger.error(
+                            f"Invalid syndication mapping payload JSON for {ghost_post_id}"
+                        )
+                        continue
+                    yield mapping
+        except sqlite3.Error as e:
+            logger.error(f"Failed to list syndication mappings from SQLite: {e}")
+
     def list_syndication_mappings(self) -> list[Dict[str, Any]]:
-        """Return all syndication mappings stored in SQLite."""
-        mappings: list[Dict[str, Any]] = []
+        """Return all syndication mappings stored in SQLite, newest first.
+
+        Ordered by ``syndicated_at`` descending so callers that walk every
+        mapping (e.g. the scheduler's sync cycle) reach recently syndicated,
+        high-engagement posts first if they are interrupted partway through.
+        """
+        return list(self.iter_syndication_mappings())
+
+    def list_syndication_mapping_timestamps(self) -> list[tuple[str, str]]:
+        """Return ``(ghost_post_id, syndicated_at)`` for every mapping, newest first.
+
+        Reads only the indexed columns, so callers that just need each mapping's
+        age (like the scheduler's skip logic) avoid decoding every JSON payload.
+        """
         try:
             with self._connect() as conn:
                 rows = conn.execute(
-                    "SELECT ghost_post_id, payload FROM syndication_mappings"
+                    "SELECT ghost_post_id, syndicated_at FROM syndication_mappings "
+                    "ORDER BY syndicated_at DESC"
                 ).fetchall()
-            for row in rows:
-                try:
-                    mapping = json.loads(row["payload"])
-                except json.JSONDecodeError:
-                    logger.error(
-                        f"Invalid syndication mapping payload JSON for {row['ghost_post_id']}"
-                    )
-                    continue
-                mappings.append(mapping)
+            return [(row["ghost_post_id"], row["syndicated_at"]) for row in rows]
         except sqlite3.Error as e:
-            logger.error(f"Failed to list syndication mappings from SQLite: {e}")
-        return mappings
+            logger.error(f"Failed to list syndication mapping timestamps from SQLite: {e}")
+            return []
 
     # =====================================================================
     # Sent Webmentions tracking
@@ -403,22 +562,53 @@ class InteractionDataStore:
 
         Upserts by (source_url, target_url) so re-sends update the timestamp.
         """
+        self.record_sent_webmentions(
+            source_url, [(target_url, endpoint)], post_id=post_id, sent_at=sent_at
+        )
+
+    def record_sent_webmentions(
+        self,
+        source_url: str,
+        targets: list[tuple[str, str]],
+        post_id: str = "",
+        sent_at: str = "",
+    ) -> None:
+        """Record several webmentions sent from one source in a single transaction.
+
+        Args:
+            source_url: URL of the post the webmentions were sent from
+            targets: ``(target_url, endpoint)`` pairs that accepted a webmention
+            post_id: Ghost post ID of the source post
+            sent_at: Timestamp shared by all rows (defaults to now)
+
+        Upserts by (source_url, target_url) like record_sent_webmention(), but
+        commits once for the whole batch instead of once per target.
+        """
         # Validate and truncate inputs to prevent database bloat
         source_url = (source_url or "")[:self._MAX_URL_LENGTH]
-        target_url = (target_url or "")[:self._MAX_URL_LENGTH]
         post_id = (post_id or "")[:self._MAX_POST_ID_LENGTH]
-        endpoint = (endpoint or "")[:self._MAX_URL_LENGTH]
 
-        if not source_url or not target_url:
-            logger.warning("Skipping sent webmention record: missing source_url or target_url")
+        if not source_url:
+            logger.warning("Skipping sent webmention records: missing source_url")
             return
 
         if not sent_at:
-            from datetime import datetime, timezone
             sent_at = datetime.now(timezone.utc).isoformat()
+
+        rows = []
+        for target_url, endpoint in targets:
+            target_url = (target_url or "")[:self._MAX_URL_LENGTH]
+            endpoint = (endpoint or "")[:self._MAX_URL_LENGTH]
+            if not target_url:
+                logger.warning("Skipping sent webmention record: missing target_url")
+                continue
+            rows.append((source_url, target_url, post_id, endpoint, sent_at))
+
+        if not rows:
+            return
         try:
             with self._connect() as conn:
-                conn.execute(
+                conn.executemany(
                     """
                     INSERT INTO sent_webmentions (source_url, target_url, post_id, endpoint, sent_at)
                     VALUES (?, ?, ?, ?, ?)
@@ -426,10 +616,13 @@ class InteractionDataStore:
                         endpoint = excluded.endpoint,
                         sent_at = excluded.sent_at
                     """,
-                    (source_url, target_url, post_id, endpoint, sent_at),
+                    rows,
                 )
         except sqlite3.Error as e:
-            logger.error(f"Failed to record sent webmention: source={source_url}, target={target_url}: {e}")
+            logger.error(
+                "Failed to record %d sent webmention(s) for source=%s: %s",
+                len(rows), source_url, e
+            )
 
     def get_sent_webmention_targets(self, source_url: str) -> list[str]:
         """Get all target URLs that received webmentions for a given source URL."""
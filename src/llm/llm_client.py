@@ -5,11 +5,18 @@ This module provides a client for interacting with vision-capable LLM services
 (like Llama 3.2 Vision) to generate descriptive alt text for images.
 """
 
+import io
 import logging
 import base64
+import hashlib
+import time
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
+from PIL import Image, ImageOps
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -31,13 +38,19 @@ class LLMClient:
     DEFAULT_MAX_TOKENS = 256
     DEFAULT_TEMPERATURE = 0.7
     DEFAULT_TOP_P = 0.95
+    DEFAULT_MAX_IMAGE_DIMENSION = 1024  # pixels - vision models resize to about this anyway
+    DOWNSCALE_JPEG_QUALITY = 85
+    HEALTH_CACHE_TTL = 30  # seconds to reuse a health-check verdict
+    ERROR_BODY_LOG_LIMIT = 256  # bytes of an error response body to log
+    MAX_ALT_TEXT_CACHE_SIZE = 256  # generated alt texts kept in memory
     
     def __init__(
         self,
         url: str,
         port: int = 5000,
         enabled: bool = True,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        max_image_dimension: Optional[int] = None
     ):
         """Initialize LLM client.
         
@@ -46,6 +59,8 @@ class LLMClient:
             port: Port number for the LLM service (default: 5000)
             enabled: Whether LLM processing is enabled (default: True)
             timeout: Request timeout in seconds (default: 60)
+            max_image_dimension: Longest side, in pixels, that images are
+                downscaled to before being sent (default: 1024)
         """
         self.enabled = enabled and bool(url)
         
@@ -53,8 +68,25 @@ class LLMClient:
             logger.info("LLM client disabled")
             self.base_url = None
             self.timeout = None
+            self._session = None
             return
         
+        # Generation parameters sent when the caller doesn't override them
+        self._payload_defaults: Dict[str, Any] = {
+            "prompt": self.DEFAULT_PROMPT,
+            "max_tokens": self.DEFAULT_MAX_TOKENS,
+            "temperature": self.DEFAULT_TEMPERATURE,
+            "top_p": self.DEFAULT_TOP_P,
+        }
+        
+        # When the service last probed healthy (monotonic clock), or None
+        self._health_checked_at: Optional[float] = None
+        
+        # Generated alt text keyed by image content and generation parameters,
+        # so re-syndicating a post doesn't re-run inference for the same image.
+        # Uses OrderedDict for LRU-style eviction
+        self._alt_text_cache: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+        
         # Construct base URL
         # Remove any trailing slashes and protocol if present in url
         url = url.rstrip('/')
@@ -64,39 +96,156 @@ class LLMClient:
             self.base_url = f"http://{url}:{port}"
         
         self.timeout = timeout or self.DEFAULT_TIMEOUT
+        self.max_image_dimension = max_image_dimension or self.DEFAULT_MAX_IMAGE_DIMENSION
+        self._session = self._build_session()
         
         logger.info(f"LLM client initialized for {self.base_url} (timeout: {self.timeout}s)")
     
-    def _encode_image_to_base64(self, image_path: str) -> Optional[str]:
-        """Encode an image file to base64.
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """Create the pooled HTTP session shared by health checks and inference.
+        
+        Every request goes to the same LLM host, so keeping connections alive
+        saves a TCP (and TLS) handshake per call. Refused connections and
+        transient gateway errors are retried briefly; urllib3 never retries
+        POST by default, so only the health probe is retried and a slow
+        inference is never re-submitted. Read timeouts are not retried: a hung
+        host would otherwise hold up the health probe for several timeouts.
+        
+        Returns:
+            Configured requests.Session
+        """
+        retries = Retry(
+            total=2,
+            read=0,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=8, max_retries=retries)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
+    def _read_image(self, image_path: str) -> Optional[bytes]:
+        """Read an image file's bytes.
         
         Args:
             image_path: Path to the image file
             
         Returns:
-            Base64-encoded image string, or None if encoding fails
+            Raw image bytes, or None if the file cannot be read
         """
         try:
             with open(image_path, 'rb') as image_file:
-                image_data = image_file.read()
-                base64_encoded = base64.b64encode(image_data).decode('utf-8')
-                return base64_encoded
+                return image_file.read()
         except Exception as e:
-            logger.error(f"Failed to encode image {image_path}: {e}")
+            logger.error(f"Failed to read image {image_path}: {e}")
             return None
     
+    @staticmethod
+    def _downscale_image(image_data: bytes, max_dimension: int, quality: int) -> bytes:
+        """Shrink an image so its longest side is at most max_dimension pixels.
+        
+        Vision models resize their input to roughly this size internally, so
+        sending a full-resolution photo only inflates the base64 payload.
+        The EXIF Orientation tag is applied to the pixels first, since
+        re-encoding drops EXIF and phone photos would otherwise reach the
+        model sideways. Upright images already within the limit are
+        returned untouched.
+        
+        Args:
+            image_data: Raw image bytes
+            max_dimension: Maximum pixel dimension for the longest side
+            quality: JPEG quality used when re-encoding
+            
+        Returns:
+            JPEG bytes of the downscaled image, or the original data if no
+            resize is needed or the image cannot be processed
+        """
+        try:
+            img = Image.open(io.BytesIO(image_data))
+            width, height = img.size
+            # 0x0112 is the EXIF Orientation tag; 1 means already upright
+            rotated = img.getexif().get(0x0112, 1) != 1
+            if max(width, height) <= max_dimension and not rotated:
+                return image_data
+            
+            if rotated:
+                img = ImageOps.exif_transpose(img)
+            # JPEG doesn't support alpha or palette modes
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+            img.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+            
+            buffer = io.BytesIO()
+            img.save(buffer, format='JPEG', quality=quality, optimize=True)
+            downscaled = buffer.getvalue()
+        except Exception as e:
+            logger.warning(f"Could not downscale image for LLM, sending original: {e}")
+            return image_data
+        
+        logger.debug(
+            f"Downscaled image from {width}x{height} ({len(image_data)} bytes) "
+            f"to {img.size[0]}x{img.size[1]} ({len(downscaled)} bytes)"
+        )
+        return downscaled
+    
+    def _get_cached_alt_text(self, key: Tuple[Any, ...]) -> Optional[str]:
+        """Return previously generated alt text for a cache key, if any."""
+        alt_text = self._alt_text_cache.get(key)
+        if alt_text is not None:
+            self._alt_text_cache.move_to_end(key)
+        return alt_text
+    
+    def _cache_alt_text(self, key: Tuple[Any, ...], alt_text: str) -> None:
+        """Remember generated alt text, evicting the least recently used entry."""
+        self._alt_text_cache[key] = alt_text
+        self._alt_text_cache.move_to_end(key)
+        while len(self._alt_text_cache) > self.MAX_ALT_TEXT_CACHE_SIZE:
+            self._alt_text_cache.popitem(last=False)
+    
+    def _invalidate_health(self) -> None:
+        """Forget the cached health verdict so the next call re-probes."""
+        self._health_checked_at = None
+    
     def _check_health(self) -> bool:
         """Check if the LLM service is healthy and ready.
         
+        A healthy verdict is cached for HEALTH_CACHE_TTL seconds so a batch of
+        images doesn't probe the service before every inference. An unhealthy
+        one is not cached: a service that is still starting up is re-probed
+        on the next call instead of disabling alt text for the whole TTL.
+        
         Returns:
             True if service is healthy, False otherwise
         """
         if not self.enabled:
             return False
         
+        now = time.monotonic()
+        if (
+            self._health_checked_at is not None
+            and now - self._health_checked_at < self.HEALTH_CACHE_TTL
+        ):
+            return True
+        
+        if not self._probe_health():
+            self._health_checked_at = None
+            return False
+        self._health_checked_at = now
+        return True
+    
+    def _probe_health(self) -> bool:
+        """Query the service's /health endpoint.
+        
+        Returns:
+            True if service is healthy, False otherwise
+        """
         try:
             health_url = f"{self.base_url}/health"
-            response = requests.get(health_url, timeout=5)  # Short timeout for health check
+            response = self._session.get(health_url, timeout=5)  # Short timeout for health check
             
             if response.status_code == 200:
                 data = response.json()
@@ -143,38 +292,65 @@ class LLMClient:
             return None
         
         try:
-            # Check health first (with caching to avoid excessive checks)
-            if not self._check_health():
-                logger.warning("LLM service not healthy, skipping alt text generation")
+            image_data = self._read_image(image_path)
+            if not image_data:
                 return None
             
-            # Encode image to base64
-            base64_image = self._encode_image_to_base64(image_path)
-            if not base64_image:
+            # Prepare request payload (image added once we know it's needed).
+            # Only explicitly passed values override the defaults, so e.g.
+            # temperature=0.0 is honoured rather than replaced.
+            payload = dict(self._payload_defaults)
+            for key, value in (
+                ("prompt", prompt),
+                ("max_tokens", max_tokens),
+                ("temperature", temperature),
+                ("top_p", top_p),
+            ):
+                if value is not None:
+                    payload[key] = value
+            
+            # Same image bytes with the same parameters: reuse the earlier result
+            cache_key = (
+                hashlib.sha256(image_data).digest(),
+                payload["prompt"],
+                payload["max_tokens"],
+                payload["temperature"],
+                payload["top_p"],
+            )
+            cached_alt = self._get_cached_alt_text(cache_key)
+            if cached_alt is not None:
+                logger.debug(f"Using cached alt text for {image_path}")
+                return cached_alt
+            
+            # Check health first (cached to avoid a probe per image)
+            if not self._check_health():
+                logger.warning("LLM service not healthy, skipping alt text generation")
                 return None
             
-            # Prepare request payload
-            payload = {
-                "prompt": prompt or self.DEFAULT_PROMPT,
-                "image": base64_image,
-                "max_tokens": max_tokens or self.DEFAULT_MAX_TOKENS,
-                "temperature": temperature or self.DEFAULT_TEMPERATURE,
-                "top_p": top_p or self.DEFAULT_TOP_P
-            }
+            # Downscale to what the model actually looks at, then encode to base64
+            image_data = self._downscale_image(
+                image_data, self.max_image_dimension, self.DOWNSCALE_JPEG_QUALITY
+            )
+            payload["image"] = base64.b64encode(image_data).decode('ascii')
             
             # Make inference request
             infer_url = f"{self.base_url}/infer"
             logger.debug(f"Sending inference request to {infer_url}")
             
-            response = requests.post(
+            response = self._session.post(
                 infer_url,
                 json=payload,
                 timeout=self.timeout
             )
             
             # Check response
+            if response.status_code >= 500:
+                self._invalidate_health()
             if response.status_code != 200:
-                logger.error(f"LLM inference failed with status {response.status_code}: {response.text}")
+                # Only the head of the body: an error page can be large, and
+                # decoding all of it just to log it is wasted work
+                body = response.content[:self.ERROR_BODY_LOG_LIMIT].decode('utf-8', 'replace')
+                logger.error(f"LLM inference failed with status {response.status_code}: {body}")
                 return None
             
             # Parse response
@@ -192,10 +368,12 @@ class LLMClient:
                 logger.warning("LLM returned empty response")
                 return None
             
+            self._cache_alt_text(cache_key, alt_text)
             logger.info(f"Generated alt text: {alt_text[:100]}...")
             return alt_text
             
         except requests.Timeout:
+            self._invalidate_health()
             logger.error(f"LLM request timed out after {self.timeout}s")
             return None
         except Exception as e:
@@ -212,6 +390,7 @@ class LLMClient:
               url: "http://llama-vision"  # or just "llama-vision"
               port: 5000
               timeout: 60  # optional
+              max_image_dimension: 1024  # optional
         
         Args:
             config: Configuration dictionary from load_config()
@@ -232,10 +411,12 @@ class LLMClient:
         url = llm_config.get("url", "")
         port = llm_config.get("port", 5000)
         timeout = llm_config.get("timeout")
+        max_image_dimension = llm_config.get("max_image_dimension")
         
         return cls(
             url=url,
             port=port,
             enabled=enabled,
-            timeout=timeout
+            timeout=timeout,
+            max_image_dimension=max_image_dimension
         )
@@ -38,6 +38,7 @@ import threading
 import time
 from typing import Optional, Dict, Any
 import requests
+from requests.adapters import HTTPAdapter
 
 
 logger = logging.getLogger(__name__)
@@ -92,6 +93,16 @@ class PushoverNotifier:
                        self.app_token is not None and 
                        self.user_key is not None)
         
+        # Credential fields sent with every notification, built once
+        self._base_payload = {"token": self.app_token, "user": self.user_key}
+        
+        # Keep-alive session for API calls (None when notifications are disabled),
+        # and the pid it was built in; see _get_session()
+        self._session: Optional[requests.Session] = (
+            self._build_session() if self.enabled else None
+        )
+        self._session_pid = os.getpid()
+        
         if not config_enabled:
             logger.info("Pushover notifications disabled via config.yml")
         elif not self.enabled:
@@ -101,6 +112,53 @@ class PushoverNotifier:
         else:
             logger.info("Pushover notifications enabled")
     
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """Create the keep-alive HTTP session used for every notification.
+        
+        Every request goes to api.pushover.net, so reusing one warm connection
+        saves a TCP and TLS handshake on each notification after the first.
+        No urllib3 retries are configured: Pushover asks clients not to retry
+        4xx responses at all and to wait several seconds before retrying 5xx,
+        and a notification is not worth blocking the caller that long.
+        
+        Returns:
+            Configured requests.Session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        session.mount("https://", adapter)
+        return session
+    
+    def _get_session(self) -> Optional[requests.Session]:
+        """Return the session for this process, rebuilding it after a fork.
+        
+        The notifier is built in the gunicorn master, which can already have
+        sent notifications before forking the worker. A forked child must not
+        write to the connection (and TLS state) it inherited, so it drops the
+        parent's session without closing it and opens its own.
+        """
+        if self._session is not None and self._session_pid != os.getpid():
+            self._session = self._build_session()
+            self._session_pid = os.getpid()
+        return self._session
+    
+    def close(self) -> None:
+        """Close the notifier's pooled HTTP connections.
+        
+        The notifier stays usable: a later notification simply opens a new
+        connection. Safe to call more than once, and on disabled notifiers.
+        """
+        session = self._get_session()
+        if session is not None:
+            session.close()
+    
+    def __enter__(self) -> "PushoverNotifier":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     @classmethod
     def from_config(cls, config: Dict[str, Any]) -> "PushoverNotifier":
         """Create PushoverNotifier from configuration dictionary.
@@ -164,27 +222,25 @@ class PushoverNotifier:
         Raises:
             Does not raise exceptions - logs errors and returns False
         """
-        if not self.enabled:
+        session = self._get_session()
+        if not self.enabled or session is None:
             logger.debug(
-                f"Pushover notification skipped (disabled): {title} - {message}"
+                "Pushover notification skipped (disabled): %s - %s", title, message
             )
             return False
         
         try:
-            payload = {
-                "token": self.app_token,
-                "user": self.user_key,
-                "title": title[:self.MAX_TITLE_LENGTH],
-                "message": message[:self.MAX_MESSAGE_LENGTH],
-                "priority": priority,
-            }
+            payload = self._base_payload.copy()
+            payload["title"] = title[:self.MAX_TITLE_LENGTH]
+            payload["message"] = message[:self.MAX_MESSAGE_LENGTH]
+            payload["priority"] = priority
             
             if url:
                 payload["url"] = url[:self.MAX_URL_LENGTH]
                 if url_title:
                     payload["url_title"] = url_title[:self.MAX_URL_TITLE_LENGTH]
             
-            response = requests.post(
+            response = session.post(
                 self.PUSHOVER_API_URL,
                 data=payload,
                 timeout=10  # 10 second timeout
@@ -192,11 +248,11 @@ class PushoverNotifier:
             
             response.raise_for_status()
             
-            logger.info(f"Pushover notification sent: {title}")
+            logger.info("Pushover notification sent: %s", title)
             return True
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to send Pushover notification: {e}")
+            logger.error("Failed to send Pushover notification: %s", e)
             return False
     
     def notify_post_received(self, post_title: str, post_id: str) -> bool:
@@ -569,3 +625,14 @@ class PushoverLoggingHandler(logging.Handler):
             self.handleError(record)
         finally:
             self._local.emitting = False
+
+    def close(self) -> None:
+        """Release the notifier's pooled connections when the handler is closed.
+
+        logging.shutdown() closes every handler at interpreter exit, which is
+        where the notifier's keep-alive connection gets cleaned up.
+        """
+        try:
+            self.notifier.close()
+        finally:
+            super().close()
@@ -800,18 +800,12 @@ def process_events(mastodon_clients: List["MastodonClient"] = None, bluesky_clie
                             f"re-sending webmentions"
                         )
 
-                    sent_count = 0
+                    sent_targets = []
                     for target_url in targets_to_send:
                         try:
                             result = send_wm(post_url, target_url)
                             if result.success:
-                                store.record_sent_webmention(
-                                    source_url=post_url,
-                                    target_url=target_url,
-                                    post_id=post_id or "",
-                                    endpoint=result.endpoint or "",
-                                )
-                                sent_count += 1
+                                sent_targets.append((target_url, result.endpoint or ""))
                                 logger.info(f"Webmention sent to outbound link: {target_url}")
                             else:
                                 logger.debug(
@@ -821,9 +815,11 @@ def process_events(mastodon_clients: List["MastodonClient"] = None, bluesky_clie
                         except Exception as link_err:
                             logger.debug(f"Webmention send error for {target_url}: {link_err}")
 
-                    if sent_count:
+                    if sent_targets:
+                        # Record every accepted target in one transaction
+                        store.record_sent_webmentions(post_url, sent_targets, post_id=post_id or "")
                         logger.info(
-                            f"Post {post_id}: sent webmentions to {sent_count} of "
+                            f"Post {post_id}: sent webmentions to {len(sent_targets)} of "
                             f"{len(targets_to_send)} outbound links"
                         )
             except Exception as link_wm_error:
@@ -46,7 +46,7 @@ def _build_worklist(
 ) -> List[Dict[str, Any]]:
     """Collect dead Mastodon mapping entries to repost, newest syndication first."""
     worklist: List[Dict[str, Any]] = []
-    for mapping in store.list_syndication_mappings():
+    for mapping in store.iter_syndication_mappings():
         ghost_post_id = str(mapping.get("ghost_post_id", ""))
         ghost_post_url = mapping.get("ghost_post_url", "")
         if not ghost_post_id:
@@ -35,8 +35,14 @@ Security:
     - Access token should be kept secret
 """
 import hashlib
+import http.cookiejar
 import logging
-from typing import Optional, Dict, Any, List, TYPE_CHECKING
+import threading
+import time
+from typing import Optional, Dict, Any, List, Tuple, TYPE_CHECKING
+
+import requests
+from requests.adapters import HTTPAdapter
 from mastodon import (
     Mastodon,
     MastodonError,
@@ -51,6 +57,13 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive sessions shared by every client on the same instance, with the
+# number of clients using each. Sessions carry no credentials: Mastodon.py sends
+# each client's access token as a per-request header, and _build_session()
+# refuses cookies so nothing set for one account is replayed for another.
+_shared_sessions: Dict[str, Tuple[requests.Session, int]] = {}
+_shared_sessions_lock = threading.Lock()
+
 
 class MastodonClient(SocialMediaClient):
     """Client for posting to Mastodon instances.
@@ -63,6 +76,7 @@ class MastodonClient(SocialMediaClient):
         access_token: Access token for authenticated API calls
         enabled: Whether Mastodon posting is enabled
         api: Mastodon API client instance (None if not enabled)
+        account: Authenticated account from the startup credential check (None if not enabled)
         notifier: PushoverNotifier instance for error notifications (optional)
         
     Example:
@@ -77,6 +91,12 @@ class MastodonClient(SocialMediaClient):
     # Mastodon character limit (500 for most instances)
     MAX_POST_LENGTH = 500
     
+    # Visibility values accepted by POST /api/v1/statuses
+    VALID_VISIBILITIES = frozenset({"public", "unlisted", "private", "direct"})
+    
+    # How long a successful credential check is trusted before re-verifying
+    VERIFY_CREDENTIALS_TTL = 300  # seconds
+    
     def __init__(self, notifier: Optional["PushoverNotifier"] = None, **kwargs):
         """Initialize MastodonClient with optional notifier.
         
@@ -85,6 +105,13 @@ class MastodonClient(SocialMediaClient):
             **kwargs: Arguments passed to SocialMediaClient parent class
         """
         self.notifier = notifier
+        self._session: Optional[requests.Session] = None
+        # Authenticated account, fetched once by the credential check in
+        # _initialize_api and reused wherever the account ID is needed.
+        self.account: Optional[Dict[str, Any]] = None
+        # (access token fingerprint, monotonic time) of the last successful
+        # credential check; see verify_credentials().
+        self._verified: Optional[Tuple[str, float]] = None
         super().__init__(**kwargs)
     
     @staticmethod
@@ -99,6 +126,56 @@ class MastodonClient(SocialMediaClient):
         """
         return isinstance(exception, (MastodonNetworkError, MastodonServerError))
 
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """Create the keep-alive HTTP session used for every API call.
+
+        All requests through a session go to the same instance, so one small
+        connection pool is enough; a few extra slots let the scheduler,
+        dead-link sweep and the accounts sharing the session post without
+        waiting on each other. No urllib3 retries are configured: transient failures are
+        already retried by _retry_with_backoff and 429s by Mastodon.py's
+        ratelimit_method="wait", and stacking a third layer would multiply
+        attempts (and re-submit non-idempotent uploads).
+        """
+        session = requests.Session()
+        # The API authenticates by token, never by cookie; don't keep any.
+        session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @classmethod
+    def _acquire_session(cls, instance_url: str) -> requests.Session:
+        """Return the shared session for an instance, creating it if needed.
+
+        Accounts on the same instance share one connection pool, so posting
+        to the second account reuses connections the first one warmed up.
+        Every call must be paired with _release_session().
+        """
+        key = instance_url.rstrip("/").lower()
+        with _shared_sessions_lock:
+            session, users = _shared_sessions.get(key, (None, 0))
+            if session is None:
+                session = cls._build_session()
+            _shared_sessions[key] = (session, users + 1)
+            return session
+
+    @staticmethod
+    def _release_session(instance_url: str) -> None:
+        """Drop one client's use of a shared session, closing it after the last."""
+        key = instance_url.rstrip("/").lower()
+        with _shared_sessions_lock:
+            session, users = _shared_sessions.get(key, (None, 0))
+            if session is None:
+                return
+            if users > 1:
+                _shared_sessions[key] = (session, users - 1)
+                return
+            del _shared_sessions[key]
+        session.close()
+
     def _initialize_api(self) -> None:
         """Initialize the Mastodon API client.
 
@@ -107,19 +184,37 @@ class MastodonClient(SocialMediaClient):
         Raises:
             Exception: If Mastodon API initialization fails
         """
-        self.api = Mastodon(
-            access_token=self.access_token,
-            api_base_url=self.instance_url,
-            request_timeout=15,  # 15 second timeout for API requests
-            # Block until the reset window on 429s instead of raising, so rate
-            # limits are honored precisely rather than retried with blind backoff.
-            ratelimit_method="wait",
-        )
-        
-        # Verify credentials immediately to catch authentication issues
+        self._session = self._acquire_session(self.instance_url)
+        try:
+            self.api = Mastodon(
+                access_token=self.access_token,
+                api_base_url=self.instance_url,
+                request_timeout=15,  # 15 second timeout for API requests
+                # Block until the reset window on 429s instead of raising, so rate
+                # limits are honored precisely rather than retried with blind backoff.
+                ratelimit_method="wait",
+                session=self._session,
+            )
+            self._authenticate()
+        except Exception:
+            # The client ends up disabled, so give back its share of the
+            # instance's session whatever went wrong.
+            self.close()
+            raise
+
+    def _authenticate(self) -> None:
+        """Verify credentials at startup to catch authentication issues early.
+
+        A transient blip is retried; it would otherwise disable the account
+        until restart.
+
+        Raises:
+            Exception: If the access token is rejected
+        """
         try:
-            account = self.api.account_verify_credentials()
-            logger.info(f"MastodonClient '{self.account_name}' authenticated as @{account['username']}")
+            account = self._verify_with_retry()
+            logger.info("MastodonClient '%s' authenticated as @%s", self.account_name, account['username'])
+            self._remember_account(account)
         except MastodonError as e:
             error_msg = f"Authentication failed for '{self.account_name}': {e}"
             logger.error(error_msg)
@@ -131,6 +226,33 @@ class MastodonClient(SocialMediaClient):
                     "Invalid or expired access token. Please regenerate the token."
                 )
             raise Exception(error_msg)
+
+    def _verify_with_retry(self) -> Dict[str, Any]:
+        """Fetch the authenticated account, retrying transient errors."""
+        return self._retry_with_backoff(
+            self.api.account_verify_credentials,
+            is_transient=self._is_transient_error,
+            operation_name=f"Mastodon verify_credentials ({self.account_name})",
+        )
+
+    def _token_fingerprint(self) -> str:
+        return hashlib.sha256((self.access_token or "").encode("utf-8")).hexdigest()
+
+    def _remember_account(self, account: Dict[str, Any]) -> None:
+        """Store a freshly verified account and when it was verified."""
+        self.account = account
+        self._verified = (self._token_fingerprint(), time.monotonic())
+
+    def close(self) -> None:
+        """Release the client's pooled HTTP connections.
+
+        The shared session is closed once no other client on the same
+        instance is using it. Safe to call more than once, and on disabled
+        clients.
+        """
+        if self._session is not None:
+            self._release_session(self.instance_url)
+            self._session = None
     
     @classmethod
     def from_config(cls, config: Dict[str, Any], notifier: Optional["PushoverNotifier"] = None) -> list["MastodonClient"]:
@@ -203,6 +325,12 @@ class MastodonClient(SocialMediaClient):
             logger.warning("Cannot post to Mastodon: client not enabled")
             return None
         
+        # Reject a bad visibility before downloading media or calling the API;
+        # the instance would refuse it anyway, after spending a rate-limit token.
+        if visibility not in self.VALID_VISIBILITIES:
+            logger.error("Cannot post to Mastodon: invalid visibility %r", visibility)
+            return None
+        
         media_ids = []
         
         try:
@@ -216,7 +344,7 @@ class MastodonClient(SocialMediaClient):
                     temp_path = self._download_image(url)
                     if not temp_path:
                         error_msg = f"Failed to download image: {url}"
-                        logger.warning(f"Skipping media upload for {url} due to download failure")
+                        logger.warning("Skipping media upload for %s due to download failure", url)
                         if self.notifier:
                             self.notifier.notify_post_failure(
                                 "Media Download Failed",
@@ -240,7 +368,7 @@ class MastodonClient(SocialMediaClient):
                             operation_name=f"Mastodon media_post ({self.account_name})",
                         )
                         media_ids.append(media["id"])
-                        logger.debug(f"Uploaded media {url} with ID {media['id']}")
+                        logger.debug("Uploaded media %s with ID %s", url, media['id'])
                     except MastodonError as e:
                         error_msg = f"Failed to upload media {url}: {e}"
                         logger.error(error_msg)
@@ -280,7 +408,7 @@ class MastodonClient(SocialMediaClient):
                 is_transient=self._is_transient_error,
                 operation_name=f"Mastodon status_post ({self.account_name})",
             )
-            logger.info(f"Successfully posted status to Mastodon: {result['url']}")
+            logger.info("Successfully posted status to Mastodon: %s", result['url'])
             return result
             
         except MastodonError as e:
@@ -301,6 +429,10 @@ class MastodonClient(SocialMediaClient):
         This method tests the connection and credentials by fetching the
         authenticated user's account information.
 
+        A successful result is reused for VERIFY_CREDENTIALS_TTL seconds, as
+        long as the access token hasn't changed, so repeated auth checks don't
+        each cost a round trip. A failed check clears the cached result.
+
         Returns:
             Dictionary containing account information, or None if verification failed
 
@@ -313,11 +445,21 @@ class MastodonClient(SocialMediaClient):
             logger.warning("Cannot verify credentials: client not enabled")
             return None
 
+        if self.account is not None and self._verified is not None:
+            fingerprint, verified_at = self._verified
+            if (
+                fingerprint == self._token_fingerprint()
+                and time.monotonic() - verified_at < self.VERIFY_CREDENTIALS_TTL
+            ):
+                return self.account
+
         try:
-            account = self.api.account_verify_credentials()
-            logger.info(f"Verified credentials for @{account['username']}")
+            account = self._verify_with_retry()
+            logger.info("Verified credentials for @%s", account['username'])
+            self._remember_account(account)
             return account
         except MastodonError as e:
+            self._verified = None
             error_msg = f"Failed to verify credentials: {e}"
             logger.error(error_msg)
             if self.notifier:
@@ -352,13 +494,15 @@ class MastodonClient(SocialMediaClient):
             ...     print(f"Status {post['id']}: {post['url']}")
         """
         if not self.enabled or not self.api:
-            logger.warning(f"Cannot get recent posts for Mastodon '{self.account_name}': client not enabled")
+            logger.warning("Cannot get recent posts for Mastodon '%s': client not enabled", self.account_name)
             return []
 
         try:
-            # Get the authenticated user's account info
-            account = self.api.account_verify_credentials()
-            account_id = account['id']
+            # The account is verified at startup; only look it up again if
+            # that result isn't available.
+            if self.account is None:
+                self._remember_account(self._verify_with_retry())
+            account_id = self.account['id']
 
             # Get the user's statuses (limit max is 40 for Mastodon API)
             statuses = self.api.account_statuses(
@@ -368,9 +512,9 @@ class MastodonClient(SocialMediaClient):
                 exclude_reblogs=True  # Only get original posts, not reblogs
             )
 
-            logger.debug(f"Retrieved {len(statuses)} recent posts from Mastodon '{self.account_name}'")
+            logger.debug("Retrieved %d recent posts from Mastodon '%s'", len(statuses), self.account_name)
             return statuses
 
         except MastodonError as e:
-            logger.error(f"Failed to get recent posts from Mastodon '{self.account_name}': {e}")
+            logger.error("Failed to get recent posts from Mastodon '%s': %s", self.account_name, e)
             return []
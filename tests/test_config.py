@@ -100,6 +100,39 @@ def test_read_secret_file_with_whitespace():
         os.unlink(temp_path)
 
 
+def test_read_secret_file_picks_up_rotated_secret():
+    """Test that a rewritten secret file is re-read rather than served from cache."""
+    with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
+        f.write("old_secret")
+        temp_path = f.name
+    
+    try:
+        assert read_secret_file(temp_path) == "old_secret"
+        with open(temp_path, "w") as f:
+            f.write("rotated_secret")
+        assert read_secret_file(temp_path) == "rotated_secret"
+    finally:
+        os.unlink(temp_path)
+
+
+def test_read_secret_file_picks_up_same_size_rewrite():
+    """Test that a same-length rewrite within one mtime tick is not served stale."""
+    with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
+        f.write("secret_one")
+        temp_path = f.name
+    
+    try:
+        st = os.stat(temp_path)
+        assert read_secret_file(temp_path) == "secret_one"
+        with open(temp_path, "w") as f:
+            f.write("secret_two")
+        # Same inode, size and mtime as before, as on a coarse-timestamp filesystem
+        os.utime(temp_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert read_secret_file(temp_path) == "secret_two"
+    finally:
+        os.unlink(temp_path)
+
+
 def test_get_timezone_name_default():
     assert get_timezone_name({}) == "UTC"
 
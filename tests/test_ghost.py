@@ -36,9 +36,12 @@ Coverage:
     $ poetry run pytest tests/test_ghost.py --cov=ghost --cov-report=html
 """
 import json
+import threading
+import time
 import pytest
 from pathlib import Path
 from queue import Queue
+from unittest.mock import MagicMock
 
 # Import Flask app factory and validation functions
 from ghost.ghost import create_app, validate_ghost_post, GhostPostValidationError
@@ -455,6 +458,102 @@ def test_invalid_post_not_queued(client_with_queue):
         "Invalid post should not be added to queue"
 
 
+def test_webhook_does_not_wait_for_notifications(valid_post_payload):
+    """Test that Pushover notifications are sent off the request thread.
+
+    A slow Pushover API must not delay the response to Ghost; the
+    received/queued notifications still go out, in order, afterwards.
+    """
+    release = threading.Event()
+    sent = []
+    notifier = MagicMock()
+    notifier.notify_post_received.side_effect = (
+        lambda *args: release.wait(5) and sent.append("received")
+    )
+    notifier.notify_post_queued.side_effect = lambda *args: sent.append("queued")
+
+    app = create_app(Queue(), notifier=notifier)
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        response = client.post(
+            "/webhook/ghost",
+            json=valid_post_payload,
+            content_type="application/json"
+        )
+
+    # The response came back while the first notification was still blocked
+    assert response.status_code == 200
+    assert sent == []
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while len(sent) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sent == ["received", "queued"]
+
+
+def _isolate_notify_worker(monkeypatch):
+    """Give a test its own notification worker, restoring the shared one after."""
+    import ghost.ghost as ghost_module
+
+    for name in ("_notify_queue", "_notify_worker", "_notify_worker_pid"):
+        monkeypatch.setattr(ghost_module, name, None)
+
+
+def test_background_notifications_share_one_worker():
+    """Test that queued notifications reuse one worker thread, in order."""
+    import ghost.ghost as ghost_module
+
+    sent = []
+    done = threading.Event()
+    ghost_module.notify_in_background(lambda: sent.append(1))
+    worker = ghost_module._notify_worker
+    ghost_module.notify_in_background(lambda: sent.append(2), done.set)
+
+    assert done.wait(5)
+    assert ghost_module._notify_worker is worker
+    assert sent == [1, 2]
+
+
+def test_background_notifications_dropped_when_queue_full(monkeypatch, caplog):
+    """Test that a burst beyond the queue bound is dropped, not piled up."""
+    import ghost.ghost as ghost_module
+
+    release = threading.Event()
+    _isolate_notify_worker(monkeypatch)
+    monkeypatch.setattr(ghost_module, "NOTIFY_QUEUE_SIZE", 1)
+    # Worker blocks on the first item, the second fills the queue
+    ghost_module.notify_in_background(lambda: release.wait(5))
+    deadline = time.monotonic() + 5
+    while not ghost_module._notify_queue.empty() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    ghost_module.notify_in_background(lambda: None)
+
+    with caplog.at_level("WARNING", logger="ghost.ghost"):
+        ghost_module.notify_in_background(lambda: None)
+
+    release.set()
+    assert "Notification queue full" in caplog.text
+
+
+def test_background_worker_restarted_after_fork(monkeypatch):
+    """Test that a forked process starts its own worker and queue."""
+    import ghost.ghost as ghost_module
+
+    _isolate_notify_worker(monkeypatch)
+    ghost_module.notify_in_background()
+    parent_worker = ghost_module._notify_worker
+    parent_queue = ghost_module._notify_queue
+
+    monkeypatch.setattr(ghost_module.os, "getpid", lambda: ghost_module._notify_worker_pid + 1)
+    done = threading.Event()
+    ghost_module.notify_in_background(done.set)
+
+    assert done.wait(5)
+    assert ghost_module._notify_worker is not parent_worker
+    assert ghost_module._notify_queue is not parent_queue
+
+
 # =============================================================================
 # Security Tests
 # =============================================================================
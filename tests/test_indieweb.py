@@ -551,7 +551,7 @@ class TestGetWebmentionConfig:
 class TestPushoverWebmentionNotifications:
     """Test suite for Pushover webmention notifications."""
 
-    @patch("notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_notify_webmention_success(self, mock_post):
         """Test webmention success notification."""
         from notifications.pushover import PushoverNotifier
@@ -578,7 +578,7 @@ class TestPushoverWebmentionNotifications:
         assert call_data["url"] == "https://blog.example.com/my-post"
         assert call_data["priority"] == 0  # Normal priority
 
-    @patch("notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_notify_webmention_failure(self, mock_post):
         """Test webmention failure notification."""
         from notifications.pushover import PushoverNotifier
@@ -82,8 +82,8 @@ class TestMastodonGetRecentPosts(unittest.TestCase):
         self.assertIn('https://blog.example.com/post1/', posts[0]['content'])
 
         # Verify API calls
-        # Note: account_verify_credentials is called twice - once during __init__, once in get_recent_posts()
-        self.assertEqual(mock_api.account_verify_credentials.call_count, 2)
+        # The account verified during __init__ is reused rather than fetched again
+        self.assertEqual(mock_api.account_verify_credentials.call_count, 1)
         mock_api.account_statuses.assert_called_once_with(
             id='12345',
             limit=20,
@@ -91,6 +91,38 @@ class TestMastodonGetRecentPosts(unittest.TestCase):
             exclude_reblogs=True
         )
 
+    @patch("social.base_client.time.sleep")
+    @patch("social.mastodon_client.Mastodon")
+    def test_get_recent_posts_refetches_account_through_verify_path(self, mock_mastodon_class, mock_sleep):
+        """Test that a missing account is re-verified with retry and cached."""
+        from mastodon import MastodonNetworkError
+
+        mock_api = MagicMock()
+        mock_mastodon_class.return_value = mock_api
+        account = {'id': '12345', 'username': 'testuser'}
+        mock_api.account_verify_credentials.return_value = account
+        mock_api.account_statuses.return_value = []
+
+        client = MastodonClient(
+            instance_url="https://mastodon.social",
+            access_token="test_token",
+            account_name="test"
+        )
+        client.account = None
+        client._verified = None
+        # A transient blip on the re-fetch is retried rather than failing
+        mock_api.account_verify_credentials.side_effect = [
+            MastodonNetworkError("blip"), account
+        ]
+
+        client.get_recent_posts(limit=20)
+
+        self.assertEqual(client.account, account)
+        self.assertEqual(mock_api.account_verify_credentials.call_count, 3)
+        # The re-fetched account counts as a fresh credential check
+        self.assertEqual(client.verify_credentials(), account)
+        self.assertEqual(mock_api.account_verify_credentials.call_count, 3)
+
     @patch("social.mastodon_client.Mastodon")
     def test_get_recent_posts_client_disabled(self, mock_mastodon_class):
         """Test get_recent_posts when client is disabled."""
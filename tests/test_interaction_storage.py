@@ -1,4 +1,9 @@
-from interactions.storage import InteractionDataStore
+import os
+import threading
+
+import pytest
+
+from interactions.storage import _SCHEMA_VERSION, InteractionDataStore
 
 
 def test_interaction_store_put_get(tmp_path):
@@ -74,3 +79,196 @@ def test_syndication_mapping_store_rejects_invalid_payload(tmp_path):
 
     loaded = store.get_syndication_mapping("invalid")
     assert loaded is None
+
+
+def test_list_syndication_mappings_returns_newest_first(tmp_path):
+    store = InteractionDataStore(str(tmp_path))
+    for post_id, syndicated_at in [
+        ("507f1f77bcf86cd799439001", "2026-01-01T00:00:00Z"),
+        ("507f1f77bcf86cd799439003", "2026-03-01T00:00:00Z"),
+        ("507f1f77bcf86cd799439002", "2026-02-01T00:00:00Z"),
+    ]:
+        store.put_syndication_mapping(post_id, {
+            "ghost_post_id": post_id,
+            "ghost_post_url": f"https://blog.example.com/{post_id}/",
+            "syndicated_at": syndicated_at,
+            "platforms": {"mastodon": {}, "bluesky": {}},
+        })
+
+    mappings = store.list_syndication_mappings()
+
+    assert [m["ghost_post_id"] for m in mappings] == [
+        "507f1f77bcf86cd799439003",
+        "507f1f77bcf86cd799439002",
+        "507f1f77bcf86cd799439001",
+    ]
+
+
+def test_list_syndication_mapping_timestamps(tmp_path):
+    store = InteractionDataStore(str(tmp_path))
+    for post_id, syndicated_at in [
+        ("507f1f77bcf86cd799439001", "2026-01-01T00:00:00Z"),
+        ("507f1f77bcf86cd799439002", "2026-02-01T00:00:00Z"),
+    ]:
+        store.put_syndication_mapping(post_id, {
+            "ghost_post_id": post_id,
+            "ghost_post_url": f"https://blog.example.com/{post_id}/",
+            "syndicated_at": syndicated_at,
+            "platforms": {"mastodon": {}, "bluesky": {}},
+        })
+
+    assert store.list_syndication_mapping_timestamps() == [
+        ("507f1f77bcf86cd799439002", "2026-02-01T00:00:00Z"),
+        ("507f1f77bcf86cd799439001", "2026-01-01T00:00:00Z"),
+    ]
+
+
+def test_connection_is_reused_within_a_thread(tmp_path):
+    store = InteractionDataStore(str(tmp_path))
+
+    assert store._connect() is store._connect()
+
+
+def test_connection_is_not_shared_across_threads(tmp_path):
+    store = InteractionDataStore(str(tmp_path))
+    other = []
+    thread = threading.Thread(target=lambda: other.append(store._connect()))
+    thread.start()
+    thread.join()
+
+    assert other[0] is not store._connect()
+
+
+def test_store_uses_wal_journal_mode(tmp_path):
+    store = InteractionDataStore(str(tmp_path))
+    conn = store._connect()
+
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    # 1 == NORMAL
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+
+def test_interaction_store_normalizes_platform_shape(tmp_path):
+    store = InteractionDataStore(str(tmp_path))
+    payload = {
+        "ghost_post_id": "507f1f77bcf86cd799439012",
+        "updated_at": "2026-01-01T00:00:00Z",
+        "platforms": {"mastodon": {}},
+    }
+
+    store.put(payload["ghost_post_id"], payload)
+
+    loaded = store.get(payload["ghost_post_id"])
+    assert loaded["platforms"] == {"mastodon": {}, "bluesky": {}}
+    assert loaded["syndication_links"] == {"mastodon": {}, "bluesky": {}}
+    # The caller's payload is left untouched
+    assert "syndication_links" not in payload
+
+
+def test_iter_syndication_mappings_is_lazy(tmp_path):
+    store = InteractionDataStore(str(tmp_path))
+    for post_id in ("507f1f77bcf86cd799439001", "507f1f77bcf86cd799439002"):
+        store.put_syndication_mapping(post_id, {
+            "ghost_post_id": post_id,
+            "ghost_post_url": f"https://blog.example.com/{post_id}/",
+            "syndicated_at": "2026-01-01T00:00:00Z",
+            "platforms": {"mastodon": {}, "bluesky": {}},
+        })
+
+    mappings = store.iter_syndication_mappings()
+
+    assert not isinstance(mappings, list)
+    assert sorted(m["ghost_post_id"] for m in mappings) == [
+        "507f1f77bcf86cd799439001",
+        "507f1f77bcf86cd799439002",
+    ]
+
+
+def test_schema_bootstrap_stamps_user_version(tmp_path):
+    InteractionDataStore(str(tmp_path))
+    # A second store on the same file sees the version and skips the DDL
+    store = InteractionDataStore(str(tmp_path))
+
+    conn = store._connect()
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == _SCHEMA_VERSION
+    tables = {
+        row["name"]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+    assert {
+        "interaction_data",
+        "syndication_mappings",
+        "webmention_replies",
+        "sent_webmentions",
+        "received_webmentions",
+    } <= tables
+
+
+def test_iter_syndication_mappings_skips_invalid_json(tmp_path):
+    store = InteractionDataStore(str(tmp_path))
+    store.put_syndication_mapping("507f1f77bcf86cd799439001", {
+        "ghost_post_id": "507f1f77bcf86cd799439001",
+        "ghost_post_url": "https://blog.example.com/a/",
+        "syndicated_at": "2026-01-01T00:00:00Z",
+        "platforms": {"mastodon": {}, "bluesky": {}},
+    })
+    with store._connect() as conn:
+        conn.execute(
+            "INSERT INTO syndication_mappings (ghost_post_id, payload, syndicated_at) "
+            "VALUES (?, ?, ?)",
+            ("507f1f77bcf86cd799439002", "{not json", "2026-02-01T00:00:00Z"),
+        )
+
+    mappings = list(store.iter_syndication_mappings())
+
+    assert [m["ghost_post_id"] for m in mappings] == ["507f1f77bcf86cd799439001"]
+
+
+def test_building_a_store_leaves_no_cached_connection(tmp_path):
+    store = InteractionDataStore(str(tmp_path))
+
+    assert getattr(store._local, "conn", None) is None
+
+
+def test_close_drops_the_threads_connection(tmp_path):
+    store = InteractionDataStore(str(tmp_path))
+    conn = store._connect()
+
+    store.close()
+
+    assert store._connect() is not conn
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_store_survives_fork(tmp_path):
+    store = InteractionDataStore(str(tmp_path))
+    mapping = {
+        "ghost_post_id": "507f1f77bcf86cd799439001",
+        "ghost_post_url": "https://blog.example.com/a/",
+        "syndicated_at": "2026-01-01T00:00:00Z",
+        "platforms": {"mastodon": {}, "bluesky": {}},
+    }
+    store.put_syndication_mapping(mapping["ghost_post_id"], mapping)
+    parent_conn = store._connect()
+
+    pid = os.fork()
+    if pid == 0:
+        # Child: write through the store built before the fork
+        status = 1
+        try:
+            child_mapping = dict(mapping, ghost_post_id="507f1f77bcf86cd799439002")
+            store.put_syndication_mapping(child_mapping["ghost_post_id"], child_mapping)
+            if store.get_syndication_mapping(child_mapping["ghost_post_id"]):
+                status = 0
+        finally:
+            os._exit(status)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+
+    # The parent's cached connection was closed before forking, not shared
+    assert store._connect() is not parent_conn
+    assert store.get_syndication_mapping("507f1f77bcf86cd799439002")["ghost_post_id"] == (
+        "507f1f77bcf86cd799439002"
+    )
+    assert store.get_syndication_mapping(mapping["ghost_post_id"]) == mapping
@@ -208,6 +208,38 @@ class TestSentWebmentionStorage:
         targets = store.get_sent_webmention_targets("https://myblog.com/post-1")
         assert len(targets) == 1
 
+    def test_record_many_in_one_call(self, store):
+        store.record_sent_webmentions(
+            "https://myblog.com/post-1",
+            [
+                ("https://a.com/1", "https://a.com/webmention"),
+                ("https://b.com/2", ""),
+                ("", "https://ignored.example/webmention"),
+            ],
+            post_id="abc123",
+        )
+        targets = store.get_sent_webmention_targets_by_post_id("abc123")
+        assert set(targets) == {"https://a.com/1", "https://b.com/2"}
+
+    def test_record_many_without_source_warns_once(self, store, caplog):
+        with caplog.at_level("WARNING", logger="interactions.storage"):
+            store.record_sent_webmentions(
+                "",
+                [("https://a.com/1", ""), ("https://b.com/2", "")],
+                post_id="abc123",
+            )
+        assert store.get_sent_webmention_targets_by_post_id("abc123") == []
+        assert len(caplog.records) == 1
+
+    def test_targets_by_post_id_use_covering_index(self, store):
+        plan = store._connect().execute(
+            "EXPLAIN QUERY PLAN "
+            "SELECT DISTINCT target_url FROM sent_webmentions WHERE post_id = ?",
+            ("abc123",),
+        ).fetchall()
+        details = " ".join(row["detail"] for row in plan)
+        assert "COVERING INDEX idx_sent_wm_post_target" in details
+
     def test_delete_by_post_id(self, store):
         store.record_sent_webmention(
             source_url="https://myblog.com/post-1",
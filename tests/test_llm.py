@@ -12,6 +12,9 @@ from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 import tempfile
 import os
+import io
+
+from PIL import Image
 
 from llm.llm_client import LLMClient
 
@@ -91,6 +94,20 @@ class TestLLMClientInitialization:
         client = LLMClient(url="llama-vision", port=5000, enabled=True, timeout=120)
         assert client.timeout == 120
     
+    def test_init_creates_pooled_session(self):
+        """Test that an enabled client keeps one session for all requests."""
+        client = LLMClient(url="llama-vision", port=5000, enabled=True)
+        assert client._session is not None
+        adapter = client._session.get_adapter(client.base_url)
+        assert adapter.max_retries.total == 2
+        # A hung host must not be re-probed on read timeouts
+        assert adapter.max_retries.read == 0
+    
+    def test_init_disabled_has_no_session(self):
+        """Test that a disabled client does not open a session."""
+        client = LLMClient(url="", enabled=False)
+        assert client._session is None
+    
     def test_from_config(self, mock_config):
         """Test creating client from config dictionary."""
         client = LLMClient.from_config(mock_config)
@@ -109,33 +126,73 @@ class TestLLMClientInitialization:
         assert client.enabled is False
 
 
-class TestLLMClientImageEncoding:
-    """Test image encoding functionality."""
+class TestLLMClientImageDownscaling:
+    """Test image downscaling before inference."""
     
-    def test_encode_image_to_base64(self, mock_image_file):
-        """Test encoding an image file to base64."""
-        client = LLMClient(url="llama-vision", port=5000, enabled=True)
-        result = client._encode_image_to_base64(mock_image_file)
-        
-        assert result is not None
-        assert isinstance(result, str)
-        # Should be valid base64
-        try:
-            base64.b64decode(result)
-        except Exception:
-            pytest.fail("Result is not valid base64")
-    
-    def test_encode_nonexistent_file(self):
-        """Test encoding a non-existent file returns None."""
+    @staticmethod
+    def _png_bytes(width, height):
+        buffer = io.BytesIO()
+        Image.new("RGBA", (width, height), (255, 0, 0, 255)).save(buffer, format="PNG")
+        return buffer.getvalue()
+    
+    def test_large_image_is_downscaled(self):
+        """Test that an oversized image is shrunk to the max dimension."""
+        data = self._png_bytes(2048, 1024)
+        result = LLMClient._downscale_image(data, 1024, 85)
+        img = Image.open(io.BytesIO(result))
+        assert img.format == "JPEG"
+        assert img.size == (1024, 512)
+    
+    def test_small_image_is_untouched(self):
+        """Test that an image within the limit is returned as-is."""
+        data = self._png_bytes(100, 50)
+        assert LLMClient._downscale_image(data, 1024, 85) is data
+    
+    @staticmethod
+    def _rotated_jpeg_bytes(width, height):
+        """A JPEG stored landscape whose EXIF says to rotate it 90° clockwise."""
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        buffer = io.BytesIO()
+        Image.new("RGB", (width, height), (255, 0, 0)).save(buffer, format="JPEG", exif=exif)
+        return buffer.getvalue()
+    
+    def test_exif_orientation_is_applied_before_downscaling(self):
+        """Test that an Orientation=6 photo reaches the model upright."""
+        data = self._rotated_jpeg_bytes(2048, 1024)
+        result = LLMClient._downscale_image(data, 1024, 85)
+        img = Image.open(io.BytesIO(result))
+        assert img.size == (512, 1024)
+    
+    def test_small_rotated_image_is_uprighted(self):
+        """Test that a rotated image within the limit is still re-encoded upright."""
+        data = self._rotated_jpeg_bytes(100, 50)
+        result = LLMClient._downscale_image(data, 1024, 85)
+        img = Image.open(io.BytesIO(result))
+        assert img.size == (50, 100)
+        assert img.getexif().get(0x0112, 1) == 1
+    
+    def test_invalid_image_returns_original(self):
+        """Test that undecodable data is passed through unchanged."""
+        data = b"not an image"
+        assert LLMClient._downscale_image(data, 1024, 85) is data
+    
+    def test_max_image_dimension_from_config(self, mock_config):
+        """Test that max_image_dimension is read from config."""
+        mock_config["llm"]["max_image_dimension"] = 512
+        client = LLMClient.from_config(mock_config)
+        assert client.max_image_dimension == 512
+    
+    def test_max_image_dimension_default(self):
+        """Test the default max_image_dimension."""
         client = LLMClient(url="llama-vision", port=5000, enabled=True)
-        result = client._encode_image_to_base64("/nonexistent/file.jpg")
-        assert result is None
+        assert client.max_image_dimension == LLMClient.DEFAULT_MAX_IMAGE_DIMENSION
 
 
 class TestLLMClientHealthCheck:
     """Test health check functionality."""
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_health_check_healthy(self, mock_get):
         """Test health check when service is healthy."""
         mock_response = Mock()
@@ -154,7 +211,7 @@ class TestLLMClientHealthCheck:
         mock_get.assert_called_once()
         assert "health" in mock_get.call_args[0][0]
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_health_check_unhealthy(self, mock_get):
         """Test health check when service is unhealthy."""
         mock_response = Mock()
@@ -170,7 +227,7 @@ class TestLLMClientHealthCheck:
         
         assert result is False
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_health_check_error(self, mock_get):
         """Test health check when request fails."""
         mock_get.side_effect = Exception("Connection error")
@@ -185,13 +242,61 @@ class TestLLMClientHealthCheck:
         client = LLMClient(url="", enabled=False)
         result = client._check_health()
         assert result is False
+    
+    @patch('requests.Session.get')
+    def test_health_check_is_cached(self, mock_get):
+        """Test that a recent verdict is reused without probing again."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"status": "healthy", "model_loaded": True}
+        mock_get.return_value = mock_response
+        
+        client = LLMClient(url="llama-vision", port=5000, enabled=True)
+        assert client._check_health() is True
+        assert client._check_health() is True
+        
+        mock_get.assert_called_once()
+    
+    @patch('requests.Session.get')
+    def test_unhealthy_verdict_is_not_cached(self, mock_get):
+        """Test that a service that recovers is used on the very next call."""
+        starting = Mock()
+        starting.status_code = 200
+        starting.json.return_value = {"status": "loading", "model_loaded": False}
+        ready = Mock()
+        ready.status_code = 200
+        ready.json.return_value = {"status": "healthy", "model_loaded": True}
+        mock_get.side_effect = [starting, ready]
+        
+        client = LLMClient(url="llama-vision", port=5000, enabled=True)
+        assert client._check_health() is False
+        assert client._check_health() is True
+        # The healthy verdict is then cached
+        assert client._check_health() is True
+        
+        assert mock_get.call_count == 2
+    
+    @patch('requests.Session.get')
+    def test_health_check_reprobes_after_invalidation(self, mock_get):
+        """Test that an invalidated verdict triggers a fresh probe."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"status": "healthy", "model_loaded": True}
+        mock_get.return_value = mock_response
+        
+        client = LLMClient(url="llama-vision", port=5000, enabled=True)
+        client._check_health()
+        client._invalidate_health()
+        client._check_health()
+        
+        assert mock_get.call_count == 2
 
 
 class TestLLMClientAltTextGeneration:
     """Test alt text generation functionality."""
     
-    @patch('requests.post')
-    @patch('requests.get')
+    @patch('requests.Session.post')
+    @patch('requests.Session.get')
     def test_generate_alt_text_success(self, mock_get, mock_post, mock_image_file):
         """Test successful alt text generation."""
         # Mock health check
@@ -227,8 +332,17 @@ class TestLLMClientAltTextGeneration:
         assert 'image' in payload
         assert 'max_tokens' in payload
     
-    @patch('requests.post')
-    @patch('requests.get')
+    @patch('requests.Session.post')
+    def test_generate_alt_text_unreadable_image(self, mock_post):
+        """Test that an image that can't be read yields None without inference."""
+        client = LLMClient(url="llama-vision", port=5000, enabled=True)
+        result = client.generate_alt_text("/nonexistent/file.jpg")
+        
+        assert result is None
+        mock_post.assert_not_called()
+    
+    @patch('requests.Session.post')
+    @patch('requests.Session.get')
     def test_generate_alt_text_custom_prompt(self, mock_get, mock_post, mock_image_file):
         """Test alt text generation with custom prompt."""
         mock_health_response = Mock()
@@ -256,6 +370,53 @@ class TestLLMClientAltTextGeneration:
         assert payload['prompt'] == "What's in this image?"
         assert payload['max_tokens'] == 100
     
+    @patch('requests.Session.post')
+    @patch('requests.Session.get')
+    def test_generate_alt_text_cached_for_same_image(self, mock_get, mock_post, mock_image_file):
+        """Test that the same image and prompt reuse the earlier result."""
+        mock_health_response = Mock()
+        mock_health_response.status_code = 200
+        mock_health_response.json.return_value = {"status": "healthy", "model_loaded": True}
+        mock_get.return_value = mock_health_response
+        
+        mock_infer_response = Mock()
+        mock_infer_response.status_code = 200
+        mock_infer_response.json.return_value = {
+            "success": True,
+            "response_text": "Cached description"
+        }
+        mock_post.return_value = mock_infer_response
+        
+        client = LLMClient(url="llama-vision", port=5000, enabled=True)
+        assert client.generate_alt_text(mock_image_file) == "Cached description"
+        assert client.generate_alt_text(mock_image_file) == "Cached description"
+        mock_post.assert_called_once()
+        
+        # A different prompt is a different request
+        client.generate_alt_text(mock_image_file, prompt="What's in this image?")
+        assert mock_post.call_count == 2
+    
+    @patch('requests.Session.post')
+    @patch('requests.Session.get')
+    def test_generate_alt_text_honours_zero_temperature(self, mock_get, mock_post, mock_image_file):
+        """Test that falsy but explicit parameters are not replaced by defaults."""
+        mock_health_response = Mock()
+        mock_health_response.status_code = 200
+        mock_health_response.json.return_value = {"status": "healthy", "model_loaded": True}
+        mock_get.return_value = mock_health_response
+        
+        mock_infer_response = Mock()
+        mock_infer_response.status_code = 200
+        mock_infer_response.json.return_value = {"success": True, "response_text": "Deterministic"}
+        mock_post.return_value = mock_infer_response
+        
+        client = LLMClient(url="llama-vision", port=5000, enabled=True)
+        client.generate_alt_text(mock_image_file, temperature=0.0)
+        
+        payload = mock_post.call_args[1]['json']
+        assert payload['temperature'] == 0.0
+        assert payload['top_p'] == LLMClient.DEFAULT_TOP_P
+    
     def test_generate_alt_text_disabled(self, mock_image_file):
         """Test that disabled client returns None."""
         client = LLMClient(url="", enabled=False)
@@ -268,8 +429,8 @@ class TestLLMClientAltTextGeneration:
         result = client.generate_alt_text("/nonexistent/file.jpg")
         assert result is None
     
-    @patch('requests.post')
-    @patch('requests.get')
+    @patch('requests.Session.post')
+    @patch('requests.Session.get')
     def test_generate_alt_text_unhealthy_service(self, mock_get, mock_post, mock_image_file):
         """Test when service is unhealthy."""
         mock_health_response = Mock()
@@ -282,8 +443,30 @@ class TestLLMClientAltTextGeneration:
         assert result is None
         mock_post.assert_not_called()
     
-    @patch('requests.post')
-    @patch('requests.get')
+    @patch('requests.Session.post')
+    @patch('requests.Session.get')
+    def test_generate_alt_text_http_error_logs_truncated_body(self, mock_get, mock_post, mock_image_file, caplog):
+        """Test that a failed inference logs only the head of the error body."""
+        mock_health_response = Mock()
+        mock_health_response.status_code = 200
+        mock_health_response.json.return_value = {"status": "healthy", "model_loaded": True}
+        mock_get.return_value = mock_health_response
+        
+        mock_infer_response = Mock()
+        mock_infer_response.status_code = 500
+        mock_infer_response.content = b"x" * 10000
+        mock_post.return_value = mock_infer_response
+        
+        client = LLMClient(url="llama-vision", port=5000, enabled=True)
+        with caplog.at_level("ERROR"):
+            result = client.generate_alt_text(mock_image_file)
+        
+        assert result is None
+        assert "x" * LLMClient.ERROR_BODY_LOG_LIMIT in caplog.text
+        assert "x" * (LLMClient.ERROR_BODY_LOG_LIMIT + 1) not in caplog.text
+    
+    @patch('requests.Session.post')
+    @patch('requests.Session.get')
     def test_generate_alt_text_inference_error(self, mock_get, mock_post, mock_image_file):
         """Test when inference returns an error."""
         mock_health_response = Mock()
@@ -304,8 +487,8 @@ class TestLLMClientAltTextGeneration:
         
         assert result is None
     
-    @patch('requests.post')
-    @patch('requests.get')
+    @patch('requests.Session.post')
+    @patch('requests.Session.get')
     def test_generate_alt_text_timeout(self, mock_get, mock_post, mock_image_file):
         """Test when request times out."""
         mock_health_response = Mock()
@@ -321,8 +504,8 @@ class TestLLMClientAltTextGeneration:
         
         assert result is None
     
-    @patch('requests.post')
-    @patch('requests.get')
+    @patch('requests.Session.post')
+    @patch('requests.Session.get')
     def test_generate_alt_text_empty_response(self, mock_get, mock_post, mock_image_file):
         """Test when model returns empty response."""
         mock_health_response = Mock()
@@ -20,6 +20,10 @@ import unittest
 from unittest.mock import patch, MagicMock, call
 import tempfile
 import os
+from email.message import Message
+
+import requests
+from requests.cookies import extract_cookies_to_jar
 
 from social.mastodon_client import MastodonClient
 
@@ -279,3 +283,139 @@ class TestMastodonClient(unittest.TestCase):
         
         # Verify result is None
         self.assertIsNone(result)
+    
+    @patch("social.mastodon_client.Mastodon")
+    def test_post_rejects_invalid_visibility(self, mock_mastodon):
+        """Test that an unknown visibility is rejected without calling the API."""
+        client = MastodonClient(
+            instance_url="https://mastodon.social",
+            access_token="test_token"
+        )
+        
+        result = client.post("Test post", visibility="followers")
+        
+        mock_mastodon.return_value.status_post.assert_not_called()
+        self.assertIsNone(result)
+    
+    @patch("social.mastodon_client.Mastodon")
+    def test_api_uses_pooled_session(self, mock_mastodon):
+        """Test that the API client is given the client's keep-alive session."""
+        client = MastodonClient(
+            instance_url="https://mastodon.social",
+            access_token="test_token"
+        )
+        
+        session = mock_mastodon.call_args.kwargs["session"]
+        self.assertIs(session, client._session)
+        
+        client.close()
+        self.assertIsNone(client._session)
+        # Closing twice is harmless
+        client.close()
+    
+    @patch("social.mastodon_client.Mastodon")
+    def test_accounts_on_same_instance_share_session(self, mock_mastodon):
+        """Test that clients on one instance share a session until the last closes."""
+        first = MastodonClient(
+            instance_url="https://shared.example",
+            access_token="token_one"
+        )
+        second = MastodonClient(
+            instance_url="https://shared.example/",
+            access_token="token_two"
+        )
+        other = MastodonClient(
+            instance_url="https://other.example",
+            access_token="token_three"
+        )
+        
+        self.assertIs(first._session, second._session)
+        self.assertIsNot(first._session, other._session)
+        
+        session = first._session
+        with patch.object(session, "close") as mock_close:
+            first.close()
+            mock_close.assert_not_called()
+            second.close()
+            mock_close.assert_called_once()
+        other.close()
+    
+    @patch("social.mastodon_client.Mastodon")
+    def test_failed_init_releases_shared_session(self, mock_mastodon):
+        """Test that any init failure gives back the client's session share."""
+        from social.mastodon_client import _shared_sessions
+        
+        # Verification fails with something other than a MastodonError
+        mock_mastodon.return_value.account_verify_credentials.return_value = {}
+        client = MastodonClient(
+            instance_url="https://broken.example",
+            access_token="test_token"
+        )
+        self.assertFalse(client.enabled)
+        self.assertNotIn("https://broken.example", _shared_sessions)
+        
+        # Constructing the API object itself fails
+        mock_mastodon.side_effect = ValueError("bad instance")
+        client = MastodonClient(
+            instance_url="https://broken.example",
+            access_token="test_token"
+        )
+        self.assertFalse(client.enabled)
+        self.assertNotIn("https://broken.example", _shared_sessions)
+    
+    def test_shared_session_refuses_cookies(self):
+        """Test that cookies set for one account are never kept for others."""
+        request = requests.Request("GET", "https://mastodon.social/api/v1/accounts/verify_credentials").prepare()
+        headers = Message()
+        headers["Set-Cookie"] = "_session_id=abc; Path=/"
+        raw = MagicMock()
+        raw._original_response.msg = headers
+        
+        plain = requests.Session()
+        extract_cookies_to_jar(plain.cookies, request, raw)
+        self.assertEqual(len(plain.cookies), 1)
+        
+        session = MastodonClient._build_session()
+        extract_cookies_to_jar(session.cookies, request, raw)
+        self.assertEqual(len(session.cookies), 0)
+    
+    @patch("social.mastodon_client.Mastodon")
+    def test_verify_credentials_reuses_recent_result(self, mock_mastodon):
+        """Test that a fresh credential check is not repeated within the TTL."""
+        mock_api = MagicMock()
+        mock_mastodon.return_value = mock_api
+        mock_api.account_verify_credentials.return_value = {"id": "1", "username": "user"}
+        
+        client = MastodonClient(
+            instance_url="https://mastodon.social",
+            access_token="test_token"
+        )
+        
+        # Startup check counts as a verification
+        self.assertEqual(client.verify_credentials()["username"], "user")
+        self.assertEqual(mock_api.account_verify_credentials.call_count, 1)
+        
+        # A changed token invalidates the cached result
+        client.access_token = "rotated_token"
+        client.verify_credentials()
+        self.assertEqual(mock_api.account_verify_credentials.call_count, 2)
+    
+    @patch("social.mastodon_client.Mastodon")
+    def test_verify_credentials_failure_clears_cache(self, mock_mastodon):
+        """Test that a failed check forces the next call to hit the API."""
+        from mastodon import MastodonError
+        mock_api = MagicMock()
+        mock_mastodon.return_value = mock_api
+        mock_api.account_verify_credentials.return_value = {"id": "1", "username": "user"}
+        
+        client = MastodonClient(
+            instance_url="https://mastodon.social",
+            access_token="test_token"
+        )
+        client._verified = None
+        mock_api.account_verify_credentials.side_effect = MastodonError("expired")
+        self.assertIsNone(client.verify_credentials())
+        
+        mock_api.account_verify_credentials.side_effect = None
+        self.assertIsNotNone(client.verify_credentials())
+        self.assertEqual(mock_api.account_verify_credentials.call_count, 3)
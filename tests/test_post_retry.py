@@ -130,6 +130,27 @@ class TestMastodonRetry(unittest.TestCase):
         self.assertEqual(mock_api.status_post.call_count, 1)
         mock_sleep.assert_not_called()
 
+    @patch("social.base_client.time.sleep")
+    @patch("social.mastodon_client.Mastodon")
+    def test_startup_credential_check_retries_transient_error(self, mock_mastodon, mock_sleep):
+        mock_api = MagicMock()
+        mock_mastodon.return_value = mock_api
+        mock_api.account_verify_credentials.side_effect = [
+            MastodonNetworkError("Connection reset"),
+            {"id": "1", "username": "u"},
+        ]
+
+        client = MastodonClient(
+            instance_url="https://mastodon.social",
+            access_token="test_token",
+            account_name="test",
+        )
+
+        # A blip during startup must not leave the account disabled
+        self.assertTrue(client.enabled)
+        self.assertEqual(mock_api.account_verify_credentials.call_count, 2)
+        self.assertEqual(mock_sleep.call_count, 1)
+
     @patch("social.base_client.time.sleep")
     @patch("social.mastodon_client.Mastodon")
     def test_idempotency_key_is_stable_across_retries(self, mock_mastodon, mock_sleep):
@@ -79,6 +79,15 @@ class TestPushoverLoggingHandler:
         handler.emit(trigger)
         assert call_count["n"] == 1
 
+    def test_close_releases_notifier_connections(self):
+        """Closing the handler (as logging.shutdown() does) closes the notifier."""
+        notifier = MagicMock()
+
+        handler = PushoverLoggingHandler(notifier)
+        handler.close()
+
+        notifier.close.assert_called_once()
+
 
 class TestPushoverNotifier:
     """Test suite for PushoverNotifier class."""
@@ -126,7 +135,7 @@ class TestPushoverNotifier:
         notifier2 = PushoverNotifier(app_token=None, user_key="key")
         assert notifier2.enabled is False
     
-    @patch("notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_send_notification_success(self, mock_post):
         """Test successful notification sending."""
         # Mock successful API response
@@ -155,7 +164,66 @@ class TestPushoverNotifier:
         assert call_args[1]["data"]["title"] == "Test Title"
         assert call_args[1]["data"]["message"] == "Test message"
     
-    @patch("notifications.pushover.requests.post")
+    def test_notifications_share_one_session(self):
+        """Test that notifications reuse the notifier's keep-alive session."""
+        notifier = PushoverNotifier(
+            app_token="test_app_token",
+            user_key="test_user_key"
+        )
+        session = notifier._session
+
+        with patch.object(session, "post") as mock_post:
+            notifier._send_notification(title="One", message="First")
+            notifier._send_notification(title="Two", message="Second")
+
+        assert mock_post.call_count == 2
+
+        # Closing drops pooled connections but leaves the notifier usable
+        with patch.object(session, "close") as mock_close:
+            notifier.close()
+            notifier.close()
+        assert mock_close.call_count == 2
+        assert notifier._session is session
+
+    def test_session_is_rebuilt_after_fork(self):
+        """Test that a forked child opens its own session instead of the parent's."""
+        notifier = PushoverNotifier(
+            app_token="test_app_token",
+            user_key="test_user_key"
+        )
+        parent_session = notifier._session
+
+        with patch("notifications.pushover.os.getpid", return_value=notifier._session_pid + 1), \
+                patch.object(parent_session, "post") as parent_post, \
+                patch.object(parent_session, "close") as parent_close, \
+                patch("requests.Session.post") as child_post:
+            notifier._send_notification(title="Child", message="After fork")
+            notifier.close()
+
+        parent_post.assert_not_called()
+        parent_close.assert_not_called()
+        child_post.assert_called_once()
+        assert notifier._session is not parent_session
+
+    def test_disabled_notifier_has_no_session(self):
+        """Test that a disabled notifier never opens a session."""
+        notifier = PushoverNotifier(config_enabled=False)
+
+        assert notifier._session is None
+        notifier.close()
+
+    def test_context_manager_closes_session(self):
+        """Test that leaving a with-block closes the notifier's connections."""
+        notifier = PushoverNotifier(app_token="test_app_token", user_key="test_user_key")
+
+        with patch.object(notifier._session, "close") as mock_close:
+            with notifier as entered:
+                assert entered is notifier
+                mock_close.assert_not_called()
+
+        mock_close.assert_called_once()
+
+    @patch("requests.Session.post")
     def test_send_notification_with_url(self, mock_post):
         """Test notification with URL and URL title."""
         mock_response = MagicMock()
@@ -179,7 +247,7 @@ class TestPushoverNotifier:
         assert call_data["url"] == "https://example.com/post"
         assert call_data["url_title"] == "View Post"
     
-    @patch("notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_send_notification_api_error(self, mock_post):
         """Test notification sending when API returns error."""
         # Mock API error response
@@ -208,7 +276,7 @@ class TestPushoverNotifier:
         
         assert result is False
     
-    @patch("notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_notify_post_received(self, mock_post):
         """Test post received notification."""
         mock_response = MagicMock()
@@ -231,7 +299,7 @@ class TestPushoverNotifier:
         assert "Welcome to Ghost" in call_data["message"]
         assert call_data["priority"] == 0  # Normal priority
     
-    @patch("notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_notify_post_queued(self, mock_post):
         """Test post queued notification."""
         mock_response = MagicMock()
@@ -256,7 +324,7 @@ class TestPushoverNotifier:
         assert call_data["url_title"] == "View Post"
         assert call_data["priority"] == 0  # Normal priority
     
-    @patch("notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_notify_validation_error(self, mock_post):
         """Test validation error notification."""
         mock_response = MagicMock()
@@ -278,7 +346,7 @@ class TestPushoverNotifier:
         assert "Missing required field: title" in call_data["message"]
         assert call_data["priority"] == 1  # High priority for errors
     
-    @patch("notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_message_length_limits(self, mock_post):
         """Test that message length limits are enforced."""
         mock_response = MagicMock()
@@ -312,7 +380,7 @@ class TestPushoverNotifier:
         assert len(call_data["url"]) <= PushoverNotifier.MAX_URL_LENGTH
         assert len(call_data["url_title"]) <= PushoverNotifier.MAX_URL_TITLE_LENGTH
     
-    @patch("notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_notification_timeout(self, mock_post):
         """Test that API calls have timeout configured."""
         mock_response = MagicMock()
@@ -398,7 +466,7 @@ class TestPushoverNotifier:
         )
         assert notifier.enabled is True
     
-    @patch("notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_notify_post_success(self, mock_post):
         """Test post success notification."""
         mock_response = MagicMock()
@@ -426,7 +494,7 @@ class TestPushoverNotifier:
         assert call_data["url_title"] == "View on Mastodon"
         assert call_data["priority"] == 0  # Normal priority
     
-    @patch("notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_notify_post_success_without_url(self, mock_post):
         """Test post success notification without URL."""
         mock_response = MagicMock()
@@ -451,7 +519,7 @@ class TestPushoverNotifier:
         assert "personal" in call_data["message"]
         assert "url" not in call_data or call_data["url"] is None
     
-    @patch("notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_notify_post_failure(self, mock_post):
         """Test post failure notification."""
         mock_response = MagicMock()
@@ -55,7 +55,7 @@ def _platforms_with_replies(reply_urls):
 # ---------------------------------------------------------------------------
 
 class TestNotifyNewSocialReply:
-    @patch("notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_sends_notification_with_correct_fields(self, mock_post):
         mock_post.return_value = MagicMock(status_code=200)
         notifier = _make_notifier()
@@ -79,7 +79,7 @@ class TestNotifyNewSocialReply:
         assert data["url_title"] == "View Reply"
         assert data["priority"] == 0
 
-    @patch("notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_truncates_long_content(self, mock_post):
         mock_post.return_value = MagicMock(status_code=200)
         notifier = _make_notifier()
@@ -115,7 +115,7 @@ class TestNotifyNewSocialReply:
 # ---------------------------------------------------------------------------
 
 class TestNotifyNewWebmentionReply:
-    @patch("notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_sends_notification_with_correct_fields(self, mock_post):
         mock_post.return_value = MagicMock(status_code=200)
         notifier = _make_notifier()
@@ -136,7 +136,7 @@ class TestNotifyNewWebmentionReply:
         assert data["url_title"] == "View Post"
         assert data["priority"] == 0
 
-    @patch("notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_truncates_long_content(self, mock_post):
         mock_post.return_value = MagicMock(status_code=200)
         notifier = _make_notifier()